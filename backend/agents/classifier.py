@@ -8,7 +8,7 @@ in 10 tokens or less. No tools, no persona.
 from typing import Optional
 
 from agents.base import BaseAgent, AgentDefinition, AgentState, ModelSize, register_agent_class
-from agents.prompts import CLASSIFIER_PROMPT
+from agents.prompts import build_classifier_prompt
 from config import TOKEN_LIMITS, TEMPERATURE
 from orchestration.messages import AgentMessage, MessageType
 
@@ -36,7 +36,7 @@ class ClassifierAgent(BaseAgent):
     async def classify(self, query: str) -> str:
         """Classify a query into TRIVIAL, SIMPLE, or COMPLEX. Returns the tier string."""
         try:
-            prompt = CLASSIFIER_PROMPT.replace("{query}", query[:500])
+            prompt = build_classifier_prompt(query[:500])
             result = await self.call_llm([{"role": "user", "content": prompt}])
             response = result["choices"][0]["message"].get("content", "").strip()
             # Strip Qwen3 thinking tags if present
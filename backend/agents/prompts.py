@@ -7,9 +7,44 @@ Architecture:
   - Prompts are built dynamically from profile configuration.
 """
 
+import re
+from types import SimpleNamespace
+
 from profile import get_profile
 
 
+# ── Profile Snapshot (resolved once, shared by all prompt builders) ──
+
+_PROFILE_SNAPSHOT = None
+
+
+def _snapshot(profile) -> SimpleNamespace:
+    """Resolve the profile fields the prompt builders need."""
+    return SimpleNamespace(
+        system_name=profile.system.name or "Assistant",
+        owner_name=profile.owner.name,
+        personality=profile.prompts.personality,
+        domains=profile.prompts.domains,
+        enabled_agents=frozenset(profile.get_enabled_agents()),
+        crm_enabled=profile.plugins.crm.enabled,
+    )
+
+
+def _profile_snapshot() -> SimpleNamespace:
+    """Return the cached snapshot of the active profile."""
+    global _PROFILE_SNAPSHOT
+    if _PROFILE_SNAPSHOT is None:
+        _PROFILE_SNAPSHOT = _snapshot(get_profile())
+    return _PROFILE_SNAPSHOT
+
+
+def invalidate_profile_snapshot():
+    """Drop cached profile-derived prompt state (call after reload_profile())."""
+    global _PROFILE_SNAPSHOT, _presentation_prompt_cache
+    _PROFILE_SNAPSHOT = None
+    _presentation_prompt_cache = None
+
+
 # ── Presentation Prompt (configurable personality) ──
 
 def build_presentation_prompt(profile=None) -> str:
@@ -18,13 +53,11 @@ def build_presentation_prompt(profile=None) -> str:
     This replaces the hardcoded VOICE_SYSTEM_PROMPT. The presentation layer
     is the only component with a persona — all other agents are task-focused.
     """
-    if profile is None:
-        profile = get_profile()
-
-    system_name = profile.system.name or "Assistant"
-    owner_name = profile.owner.name
-    personality = profile.prompts.personality
-    domains = profile.prompts.domains
+    snap = _profile_snapshot() if profile is None else _snapshot(profile)
+    system_name = snap.system_name
+    owner_name = snap.owner_name
+    personality = snap.personality
+    domains = snap.domains
 
     # Default personality if none configured
     if not personality:
@@ -50,25 +83,34 @@ Helpful with composure. You explain your thinking without excessive caveats. Int
 
 But you're capable of anything needed. These are your strengths, not your limits."""
 
-    return f"""You are {system_name}{f', built for {owner_name}' if owner_name else ''}.
+    parts: list[str] = ["You are ", system_name]
+    if owner_name:
+        parts.append(", built for ")
+        parts.append(owner_name)
+    parts.append(""".
 
 ## Your Personality
 
-{personality}
+""")
+    parts.append(personality)
+    parts.append("""
 
 ## Your Voice
 
 Good responses: "Done." / "That won't work because [reason]. Want me to try [alternative]?" / "Three options: [list]. I'd go with the second — here's why." / "Bad idea. [Why.] But if you want to proceed, here's how."
 
 Never start with "Certainly!", "Absolutely!", "Great question!", "I'd be happy to help!", or "That's a great question! There are many factors to consider..."
-{owner_section}{domains_section}"""
+""")
+    parts.append(owner_section)
+    parts.append(domains_section)
+    return "".join(parts)
 
 
-# Cached prompt (built once on first access)
+# Cached prompt (built once at import, rebuilt only after invalidate_profile_snapshot())
 _presentation_prompt_cache = None
 
 def get_presentation_prompt() -> str:
-    """Get the cached presentation prompt."""
+    """Get the cached presentation prompt (shared with VOICE_SYSTEM_PROMPT)."""
     global _presentation_prompt_cache
     if _presentation_prompt_cache is None:
         _presentation_prompt_cache = build_presentation_prompt()
@@ -79,19 +121,19 @@ def get_presentation_prompt() -> str:
 
 def build_trivial_prompt(current_time: str = "") -> str:
     """Build the trivial response prompt with profile personality."""
-    profile = get_profile()
-    system_name = profile.system.name or "Assistant"
-    owner_name = profile.owner.name or "the user"
-    personality = profile.prompts.personality
+    snap = _profile_snapshot()
+    system_name = snap.system_name
+    owner_name = snap.owner_name or "the user"
+    personality = snap.personality
 
     if not personality:
         personality = "Direct, concise, warm without being performative. Dry wit welcome."
 
-    return f"""You are {system_name}, personal AI assistant serving {owner_name}.
-
-{personality}
-
-Current time: {current_time}
+    parts: list[str] = [
+        "You are ", system_name, ", personal AI assistant serving ", owner_name, ".\n\n",
+        personality,
+        "\n\nCurrent time: ", current_time,
+        """
 
 Keep responses short for casual chat. One or two sentences max for greetings.
 Examples of good responses:
@@ -100,7 +142,9 @@ Examples of good responses:
 - "Anytime sir."
 - "Welcome back. Nothing urgent while you were out."
 
-Never start with "Certainly!", "Absolutely!", "Great question!", or "I'd be happy to help!" """
+Never start with "Certainly!", "Absolutely!", "Great question!", or "I'd be happy to help!" """,
+    ]
+    return "".join(parts)
 
 
 # Legacy aliases for backward compatibility during transition
@@ -117,8 +161,8 @@ Respond to the user naturally and concisely."""
 def _init_legacy_prompts():
     """Initialize legacy prompt constants from profile (called on first import)."""
     global VOICE_SYSTEM_PROMPT, TRIVIAL_RESPONSE_PROMPT
-    profile = get_profile()
-    VOICE_SYSTEM_PROMPT = build_presentation_prompt(profile)
+    # Seeds the get_presentation_prompt() cache so the prompt is built once per process
+    VOICE_SYSTEM_PROMPT = get_presentation_prompt()
     TRIVIAL_RESPONSE_PROMPT = build_trivial_prompt()
 
 _init_legacy_prompts()
@@ -128,11 +172,10 @@ _init_legacy_prompts()
 
 def build_planner_prompt(tool_descriptions: str = "{tool_descriptions}") -> str:
     """Build the planner prompt with a dynamic agent table from profile."""
-    profile = get_profile()
-    enabled_agents = set(profile.get_enabled_agents())
-    if profile.plugins.crm.enabled:
-        enabled_agents.add("outreach")
-        enabled_agents.add("content")
+    snap = _profile_snapshot()
+    enabled_agents = snap.enabled_agents
+    if snap.crm_enabled:
+        enabled_agents = enabled_agents | {"outreach", "content"}
 
     # Build agent table rows dynamically
     agent_rows = []
@@ -150,7 +193,7 @@ def build_planner_prompt(tool_descriptions: str = "{tool_descriptions}") -> str:
         "claude": ("Claude", "claude", "Complex code mods, multi-file refactors, terminal ops",
                    "External API", "None"),
     }
-    if profile.plugins.crm.enabled:
+    if snap.crm_enabled:
         agent_catalog["outreach"] = ("Outreach", "outreach",
                                       "Campaign management, prospect research, email drafting",
                                       "Primary model",
@@ -324,6 +367,14 @@ Query: {query}
 
 Answer:"""
 
+# Split once at import so per-turn prompt building is plain concatenation
+_CLASSIFIER_PREFIX, _, _CLASSIFIER_SUFFIX = CLASSIFIER_PROMPT.partition("{query}")
+
+
+def build_classifier_prompt(query: str) -> str:
+    """Fill CLASSIFIER_PROMPT with the user query."""
+    return _CLASSIFIER_PREFIX + query + _CLASSIFIER_SUFFIX
+
 # ── Specialist Agent Prompts (NO persona — pure task execution) ──
 
 CODER_SYSTEM_PROMPT = """You are a technical specialist with three domains: code, desktop control, and engineering prototyping.
@@ -426,7 +477,7 @@ PLANNER_PROMPT += ENGINEERING_PLANNER_ADDENDUM
 
 # ── Security Patterns (used by passive screening) ──
 
-SUSPICIOUS_PATTERNS = [
+_RAW_SUSPICIOUS_PATTERNS = (
     r"ignore\s+(previous|above|all)\s+(instructions|prompts)",
     r"you\s+are\s+now\s+",
     r"system\s*:\s*",
@@ -436,4 +487,16 @@ SUSPICIOUS_PATTERNS = [
     r"new\s+instructions?\s*:",
     r"ADMIN\s*:",
     r"override\s+mode",
-]
+)
+
+# Compiled once at import; screeners call .search() directly
+SUSPICIOUS_PATTERNS: tuple[re.Pattern, ...] = tuple(
+    re.compile(p, re.IGNORECASE) for p in _RAW_SUSPICIOUS_PATTERNS
+)
+
+# Single alternation of all patterns, one scan per input. Alternative i is
+# wrapped in group "p<i>", so match.lastgroup names the pattern that hit.
+SUSPICIOUS_UNION: re.Pattern = re.compile(
+    "|".join(f"(?P<p{i}>{p})" for i, p in enumerate(_RAW_SUSPICIOUS_PATTERNS)),
+    re.IGNORECASE,
+)
@@ -7,6 +7,7 @@ triggers escalation. No persona — pure task decomposition and routing.
 """
 
 import json
+import re
 from typing import Optional
 
 from agents.base import BaseAgent, AgentDefinition, AgentState, ModelSize, register_agent_class
@@ -18,6 +19,9 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Markdown code fence around the planner's JSON (optional language tag / closing fence)
+_FENCE_RE = re.compile(r"```[a-zA-Z]*\s*(.*?)\s*(?:```)?\s*$", re.DOTALL)
+
 
 @register_agent_class
 class ReasonerAgent(BaseAgent):
@@ -68,11 +72,9 @@ class ReasonerAgent(BaseAgent):
             raw = result["choices"][0]["message"].get("content", "").strip()
 
             # Strip markdown fences if present
-            if raw.startswith("```"):
-                raw = raw.split("\n", 1)[1] if "\n" in raw else raw[3:]
-                if raw.endswith("```"):
-                    raw = raw[:-3]
-                raw = raw.strip()
+            m = _FENCE_RE.match(raw)
+            if m:
+                raw = m.group(1)
 
             plan = json.loads(raw)
 
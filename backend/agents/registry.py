@@ -2,6 +2,7 @@
 AgentRegistry — central registry for all system agents.
 """
 
+import sys
 from typing import Optional
 
 from agents.base import BaseAgent
@@ -12,10 +13,17 @@ class AgentRegistry:
 
     def __init__(self):
         self._agents: dict[str, BaseAgent] = {}
+        # Routing fallbacks, maintained on register() so route_task() skips lookups
+        self._default_agent: Optional[BaseAgent] = None
+        self._security_agents: list[BaseAgent] = []
 
     def register(self, agent: BaseAgent):
-        """Register an agent by its agent_id."""
-        self._agents[agent.agent_id] = agent
+        """Register an agent by its agent_id (interned for fast key compares)."""
+        agent_id = sys.intern(agent.agent_id)
+        self._agents[agent_id] = agent
+        if agent_id == "hermes":
+            self._default_agent = agent
+        self._security_agents = self.by_capability("security")
 
     def get(self, agent_id: str) -> Optional[BaseAgent]:
         """Get an agent by ID."""
@@ -50,10 +58,8 @@ class AgentRegistry:
             return agent
 
         # Capability fallback — check if the task description hints at capabilities
-        if task.get("security_consultation"):
-            candidates = self.by_capability("security")
-            if candidates:
-                return candidates[0]
+        if self._security_agents and task.get("security_consultation"):
+            return self._security_agents[0]
 
         # Default to hermes
-        return self._agents.get("hermes")
+        return self._default_agent
@@ -6,16 +6,123 @@ Handles consultations, continuous audit, and anomaly detection.
 No persona — pure security analysis. Escalations go to the user.
 """
 
+import bisect
 import re
-import uuid
+import secrets
+from collections import defaultdict, deque
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import Optional
 
 from agents.base import BaseAgent, AgentDefinition, AgentState, ModelSize, register_agent_class
-from config import TOKEN_LIMITS, TEMPERATURE, SECURITY_MONITOR_CONFIG
+from config import TOKEN_LIMITS, TEMPERATURE, SECURITY_MONITOR_CONFIG, COGNITIVE_LOOP_CONFIG
 from orchestration.messages import AgentMessage, MessageType, MessagePriority
 
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Optional: Hyperscan multi-pattern matcher (pip install hyperscan)
+try:
+    import hyperscan
+    HAS_HYPERSCAN = True
+except ImportError:
+    HAS_HYPERSCAN = False
+
+
+# ── Pattern Tables (compiled once at import) ──
+
+# (pattern, category, confidence) — matched case-insensitively
+_SUSPICIOUS_PATTERNS = (
+    (r"ignore\s+(previous|above|all)\s+(instructions|prompts)", "prompt_injection", 0.85),
+    (r"you\s+are\s+now\s+", "role_override", 0.80),
+    (r"system\s*:\s*", "system_injection", 0.75),
+    (r"<\s*system\s*>", "system_injection", 0.80),
+    (r"forget\s+(everything|your\s+instructions)", "prompt_injection", 0.85),
+    (r"new\s+instructions?\s*:", "prompt_injection", 0.80),
+    (r"ADMIN\s*:", "privilege_escalation", 0.75),
+    (r"override\s+mode", "privilege_escalation", 0.70),
+    (r"data\s+exfiltration", "content_red_flag", 0.60),
+    (r"active\s+exploitation", "content_red_flag", 0.65),
+)
+
+_SUSPICIOUS_COMPILED = tuple(
+    (re.compile(p, re.IGNORECASE), category, confidence)
+    for p, category, confidence in _SUSPICIOUS_PATTERNS
+)
+
+# Single alternation — clean content (the common case) is rejected in one pass
+_SUSPICIOUS_UNION = re.compile(
+    "|".join(f"(?:{p})" for p, _, _ in _SUSPICIOUS_PATTERNS), re.IGNORECASE,
+)
+
+
+def _build_hyperscan_db(patterns) -> Optional["hyperscan.Database"]:
+    """Compile patterns into one Hyperscan block-mode database (ids = list index).
+
+    Returns None when Hyperscan is unavailable or rejects a pattern, in which
+    case callers fall back to the compiled ``re`` tables.
+    """
+    if not HAS_HYPERSCAN:
+        return None
+    flags = (hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH
+             | hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_UCP)
+    try:
+        db = hyperscan.Database()
+        db.compile(
+            expressions=[p.encode() for p in patterns],
+            ids=list(range(len(patterns))),
+            elements=len(patterns),
+            flags=[flags] * len(patterns),
+        )
+        return db
+    except Exception as e:
+        logger.warning("Hyperscan compile failed, using re fallback: %s", e)
+        return None
+
+
+def _collect_match_id(pattern_id, start, end, flags, context):
+    """Hyperscan match callback — record which pattern fired."""
+    context.add(pattern_id)
+
+
+_SUSPICIOUS_HS_DB = _build_hyperscan_db([p for p, _, _ in _SUSPICIOUS_PATTERNS])
+
+
+def _suspicious_matches(content: str) -> list[int]:
+    """Return indexes into _SUSPICIOUS_COMPILED of every pattern found in content."""
+    if _SUSPICIOUS_HS_DB is not None:
+        matched: set[int] = set()
+        _SUSPICIOUS_HS_DB.scan(content.encode(), match_event_handler=_collect_match_id,
+                               context=matched)
+        return sorted(matched)
+    # Clean content (the common case) is rejected by the union in one pass
+    if not _SUSPICIOUS_UNION.search(content):
+        return []
+    return [i for i, (pattern, _, _) in enumerate(_SUSPICIOUS_COMPILED) if pattern.search(content)]
+
+
+# Senders whose content is never pattern-scanned (unless marked external_input).
+# The monitor's own analyses quote red-flag phrases and would flag themselves.
+# "scheduler" is deliberately absent: it relays planner task text derived from
+# untrusted user input.
+_TRUSTED_SENDERS = frozenset({"security"})
+
+_CRITICAL_MARKERS = (
+    r"critical\s+vulnerabilit",
+    r"immediate\s+risk",
+    r"active\s+exploitation",
+    r"zero[- ]day",
+    r"data\s+exfiltration",
+    r"prompt\s+injection\s+detected",
+    r"manipulation\s+attempt",
+)
+
+# Named group per marker: one finditer pass, m.lastgroup says which marker hit
+_CRITICAL_UNION = re.compile(
+    "|".join(f"(?P<m{i}>{m})" for i, m in enumerate(_CRITICAL_MARKERS)), re.IGNORECASE,
+)
+
 
 @dataclass
 class AuditFlag:
@@ -53,18 +160,20 @@ class SecurityAgent(BaseAgent):
             temperature=TEMPERATURE.get("security", 0.3),
         )
         super().__init__(definition, agent_core)
-        self.audit_queue: list[AgentMessage] = []
+        # Bounded: the oldest messages are evicted on append once full
+        self.audit_queue: deque[AgentMessage] = deque(
+            maxlen=SECURITY_MONITOR_CONFIG.get("max_audit_queue_size", 500),
+        )
         self._reviewed_up_to: str = datetime.now(timezone.utc).isoformat()
-        self._flags: list[AuditFlag] = []
+        # Flags kept sorted by confidence (parallel lists) so get_flags() can bisect
+        self._flag_confs: list[float] = []
+        self._flags_sorted: list[AuditFlag] = []
 
     # ── Bus Monitor Hook ──
 
     def receive_bus_copy(self, msg: AgentMessage):
         """Called by MessageBus on every send() to feed messages to the audit queue."""
         self.audit_queue.append(msg)
-        max_size = SECURITY_MONITOR_CONFIG.get("max_audit_queue_size", 500)
-        if len(self.audit_queue) > max_size:
-            self.audit_queue = self.audit_queue[-max_size:]
 
     # ── Agent Run ──
 
@@ -220,17 +329,16 @@ class SecurityAgent(BaseAgent):
         flags: list[AuditFlag] = []
         now = datetime.now(timezone.utc).isoformat()
 
-        agent_recipients: dict[str, set[str]] = {}
+        agent_recipients: defaultdict[str, set[str]] = defaultdict(set)
 
         for msg in self.audit_queue:
             # Track per-agent message patterns
-            if msg.sender not in agent_recipients:
-                agent_recipients[msg.sender] = set()
             agent_recipients[msg.sender].add(msg.recipient)
 
             # Content-level red flags
-            content_flags = self._scan_content(msg)
-            flags.extend(content_flags)
+            if msg.sender in _TRUSTED_SENDERS and not msg.payload.get("external_input"):
+                continue
+            flags.extend(self._scan_content(msg, now))
 
         # Unusual fan-out detection
         for sender, recipients in agent_recipients.items():
@@ -238,7 +346,7 @@ class SecurityAgent(BaseAgent):
                 continue
             if len(recipients) > 3:
                 flags.append(AuditFlag(
-                    id=str(uuid.uuid4())[:12],
+                    id=secrets.token_hex(6),
                     timestamp=now,
                     category="unusual_routing",
                     confidence=0.5,
@@ -247,54 +355,70 @@ class SecurityAgent(BaseAgent):
                     details="Possible lateral movement or unexpected communication pattern.",
                 ))
 
-        self._flags.extend(flags)
+        self._add_flags(flags)
         self._reviewed_up_to = now
         self.audit_queue.clear()
+
+        # Urgent flags shouldn't wait out the cognitive loop's sleep
+        urgent = COGNITIVE_LOOP_CONFIG.get("urgent_threshold", 0.8)
+        cognitive_loop = getattr(self._core, "cognitive_loop", None)
+        if cognitive_loop and any(f.confidence > urgent for f in flags):
+            cognitive_loop.notify_urgent()
         return flags
 
-    def _scan_content(self, msg: AgentMessage) -> list[AuditFlag]:
-        """Scan a single message's content for red flags."""
-        flags = []
-        content = msg.content.lower() if msg.content else ""
-        now = datetime.now(timezone.utc).isoformat()
+    def _scan_content(self, msg: AgentMessage, now: Optional[str] = None) -> list[AuditFlag]:
+        """Scan a single message's content for red flags.
 
-        suspicious_patterns = [
-            (r"ignore\s+(previous|above|all)\s+(instructions|prompts)", "prompt_injection", 0.85),
-            (r"you\s+are\s+now\s+", "role_override", 0.80),
-            (r"system\s*:\s*", "system_injection", 0.75),
-            (r"<\s*system\s*>", "system_injection", 0.80),
-            (r"forget\s+(everything|your\s+instructions)", "prompt_injection", 0.85),
-            (r"new\s+instructions?\s*:", "prompt_injection", 0.80),
-            (r"ADMIN\s*:", "privilege_escalation", 0.75),
-            (r"override\s+mode", "privilege_escalation", 0.70),
-            (r"(?i)data\s+exfiltration", "content_red_flag", 0.60),
-            (r"(?i)active\s+exploitation", "content_red_flag", 0.65),
-        ]
-
-        for pattern, category, confidence in suspicious_patterns:
-            if re.search(pattern, content):
-                flags.append(AuditFlag(
-                    id=str(uuid.uuid4())[:12],
-                    timestamp=now,
-                    category=category,
-                    confidence=confidence,
-                    summary=f"Pattern match '{category}' in message from {msg.sender} to {msg.recipient}",
-                    source_message_id=msg.id,
-                    details=f"Matched pattern: {pattern}",
-                ))
+        ``now`` is the flag timestamp; review_audit_queue passes one per review.
+        """
+        flags = []
+        content = msg.content or ""
+        # Bound work on large LLM/tool outputs: scan a window at each end.
+        # Injected instructions sit at the start or are appended at the end;
+        # flags carry source_message_id so the full message can be inspected.
+        window = SECURITY_MONITOR_CONFIG.get("max_scan_chars", 8192)
+        if len(content) > 2 * window:
+            hits = sorted(set(_suspicious_matches(content[:window]))
+                          | set(_suspicious_matches(content[-window:])))
+        else:
+            hits = _suspicious_matches(content)
+        if not hits:
+            return flags
+        if now is None:
+            now = datetime.now(timezone.utc).isoformat()
+
+        for i in hits:
+            pattern, category, confidence = _SUSPICIOUS_COMPILED[i]
+            flags.append(AuditFlag(
+                id=secrets.token_hex(6),
+                timestamp=now,
+                category=category,
+                confidence=confidence,
+                summary=f"Pattern match '{category}' in message from {msg.sender} to {msg.recipient}",
+                source_message_id=msg.id,
+                details=f"Matched pattern: {pattern.pattern}",
+            ))
 
         return flags
 
+    def _add_flags(self, flags: list[AuditFlag]):
+        """Insert flags in confidence order (stable for equal confidences)."""
+        for f in flags:
+            idx = bisect.bisect_right(self._flag_confs, f.confidence)
+            self._flag_confs.insert(idx, f.confidence)
+            self._flags_sorted.insert(idx, f)
+
     def get_flags(self, min_confidence: float = 0.0) -> list[AuditFlag]:
-        """Return accumulated flags, optionally filtered by confidence."""
-        return [f for f in self._flags if f.confidence >= min_confidence]
+        """Return accumulated flags with confidence >= min_confidence, lowest first."""
+        return self._flags_sorted[bisect.bisect_left(self._flag_confs, min_confidence):]
 
     def get_and_clear_audit_data(self) -> tuple[list[AgentMessage], list[AuditFlag]]:
         """Return the full audit queue and flags, then clear them."""
         queue = list(self.audit_queue)
-        flags = list(self._flags)
+        flags = self._flags_sorted
         self.audit_queue.clear()
-        self._flags.clear()
+        self._flag_confs = []
+        self._flags_sorted = []
         return queue, flags
 
     async def handle_system_scan(self, scan_data: dict) -> str:
@@ -313,19 +437,13 @@ class SecurityAgent(BaseAgent):
     def _check_for_observations(self, analysis: str) -> list[str]:
         """Check if the analysis contains concerning observations worth flagging."""
         observations = []
-        critical_markers = [
-            r"(?i)critical\s+vulnerabilit",
-            r"(?i)immediate\s+risk",
-            r"(?i)active\s+exploitation",
-            r"(?i)zero[- ]day",
-            r"(?i)data\s+exfiltration",
-            r"(?i)prompt\s+injection\s+detected",
-            r"(?i)manipulation\s+attempt",
-        ]
-        for marker in critical_markers:
-            match = re.search(marker, analysis)
-            if match:
-                start = max(0, match.start() - 100)
-                end = min(len(analysis), match.end() + 100)
-                observations.append(analysis[start:end].strip())
+        seen_markers: set[str] = set()
+        for match in _CRITICAL_UNION.finditer(analysis):
+            # One snippet per marker (its first occurrence)
+            if match.lastgroup in seen_markers:
+                continue
+            seen_markers.add(match.lastgroup)
+            start = max(0, match.start() - 100)
+            end = min(len(analysis), match.end() + 100)
+            observations.append(analysis[start:end].strip())
         return observations
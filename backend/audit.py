@@ -1,42 +1,175 @@
 """
 Audit Logger — Security event tracking for Moose.
 Logs security-relevant events to the audit_log table.
+
+Writes are queued and committed in batches by a single background thread,
+so request handlers never wait on SQLite.
 """
 
+import atexit
 import json
 import logging
+import queue
+import secrets
+import sqlite3
+import threading
 import time
-import uuid
 from typing import Optional
 
-from db import db_connection
+import db
+from db import db_connection_row
 
 logger = logging.getLogger(__name__)
 
+# Optional: orjson serializes metadata ~2-3x faster than stdlib json
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+def _dumps_metadata(metadata: dict) -> str:
+    """Serialize audit metadata to a JSON string."""
+    if HAS_ORJSON:
+        try:
+            return orjson.dumps(metadata).decode()
+        except TypeError:
+            pass  # e.g. non-str keys or >64-bit ints — stdlib json accepts them
+    return json.dumps(metadata)
+
+
+# ── Background Writer ──
+
+_AUDIT_QUEUE_MAX = 10000       # pending rows before new events are dropped
+_AUDIT_BATCH_MAX = 500         # rows per executemany/commit
+_AUDIT_COALESCE_SECONDS = 0.05  # wait after the first row so bursts share a commit
+
+_AUDIT_COLUMNS = ("id, timestamp, event_type, actor, ip_address, endpoint, "
+                  "method, status_code, request_summary, metadata")
+
+_INSERT_SQL = f"INSERT INTO audit_log ({_AUDIT_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+
+_audit_q: queue.Queue = queue.Queue(maxsize=_AUDIT_QUEUE_MAX)
+_writer_thread: Optional[threading.Thread] = None
+_writer_lock = threading.Lock()
+
+# Owned by the writer thread; kept open so sqlite3's statement cache is reused
+_writer_conn: Optional[sqlite3.Connection] = None
+_writer_conn_path = None
+
+
+def _writer_connection() -> sqlite3.Connection:
+    """Return the writer's long-lived connection, (re)opening it if DB_PATH changed."""
+    global _writer_conn, _writer_conn_path
+    if _writer_conn is None or _writer_conn_path != db.DB_PATH:
+        _close_writer_connection()
+        conn = sqlite3.connect(str(db.DB_PATH))
+        conn.execute("PRAGMA busy_timeout = 5000")
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.execute("PRAGMA synchronous = NORMAL")  # WAL-safe; no fsync per commit
+        conn.execute("PRAGMA temp_store = MEMORY")
+        _writer_conn, _writer_conn_path = conn, db.DB_PATH
+    return _writer_conn
+
+
+def _close_writer_connection():
+    """Close the writer connection, if open."""
+    global _writer_conn
+    if _writer_conn is not None:
+        try:
+            _writer_conn.close()
+        except Exception:
+            pass
+        _writer_conn = None
+
+
+def _write_batch(batch: list[tuple]):
+    """Serialize metadata and insert a batch of audit rows in one transaction.
+
+    Queued rows carry the metadata dict as their last field so callers never
+    pay for JSON encoding; a row whose metadata can't be encoded is dropped.
+    """
+    rows = []
+    for item in batch:
+        metadata = item[-1]
+        try:
+            rows.append(item[:-1] + (_dumps_metadata(metadata) if metadata else None,))
+        except Exception as e:
+            logger.error("Audit metadata not serializable (%s event): %s", item[2], e)
+    conn = _writer_connection()
+    try:
+        conn.executemany(_INSERT_SQL, rows)
+        conn.commit()
+    except Exception:
+        # Start from a fresh connection on the next batch
+        _close_writer_connection()
+        raise
+
+
+def _writer_loop():
+    """Drain the audit queue forever, committing up to _AUDIT_BATCH_MAX rows at a time."""
+    while True:
+        batch = [_audit_q.get()]
+        time.sleep(_AUDIT_COALESCE_SECONDS)
+        while len(batch) < _AUDIT_BATCH_MAX:
+            try:
+                batch.append(_audit_q.get_nowait())
+            except queue.Empty:
+                break
+        try:
+            _write_batch(batch)
+        except Exception as e:
+            # Don't let audit failures break the application
+            logger.error("Audit log failed (%d entries): %s", len(batch), e)
+        finally:
+            for _ in batch:
+                _audit_q.task_done()
+
+
+def _ensure_writer():
+    """Start the writer thread on first use (or if it has died)."""
+    global _writer_thread
+    if _writer_thread is not None and _writer_thread.is_alive():
+        return
+    with _writer_lock:
+        if _writer_thread is None or not _writer_thread.is_alive():
+            _writer_thread = threading.Thread(
+                target=_writer_loop, name="audit-writer", daemon=True,
+            )
+            _writer_thread.start()
+
+
+# Known event types for validation
+_EVENT_TYPES = frozenset({
+    "auth_success",
+    "auth_failure",
+    "key_rotation",
+    "task_start",
+    "task_complete",
+    "escalation_requested",
+    "escalation_approved",
+    "escalation_denied",
+    "file_access",
+    "file_write",
+    "shell_command",
+    "email_sent",
+    "rate_limit_hit",
+    "security_flag",
+    "api_request",
+    "websocket_connect",
+    "websocket_disconnect",
+})
+
+# Unknown event types already reported — each is warned about only once
+_warned_types: set[str] = set()
+
 
 class AuditLogger:
     """Log security-relevant events to audit_log table."""
 
     # Known event types for validation
-    EVENT_TYPES = {
-        "auth_success",
-        "auth_failure",
-        "key_rotation",
-        "task_start",
-        "task_complete",
-        "escalation_requested",
-        "escalation_approved",
-        "escalation_denied",
-        "file_access",
-        "file_write",
-        "shell_command",
-        "email_sent",
-        "rate_limit_hit",
-        "security_flag",
-        "api_request",
-        "websocket_connect",
-        "websocket_disconnect",
-    }
+    EVENT_TYPES = _EVENT_TYPES
 
     @staticmethod
     def log(
@@ -49,7 +182,7 @@ class AuditLogger:
         request_summary: Optional[str] = None,
         metadata: Optional[dict] = None,
     ):
-        """Log an audit event to the database.
+        """Queue an audit event for the background writer (non-blocking).
 
         Args:
             event_type: Type of event (should be in EVENT_TYPES)
@@ -61,35 +194,44 @@ class AuditLogger:
             request_summary: Brief description of the request (truncated to 500 chars)
             metadata: Additional context as JSON-serializable dict
         """
-        if event_type not in AuditLogger.EVENT_TYPES:
+        if event_type not in _EVENT_TYPES and event_type not in _warned_types:
+            _warned_types.add(event_type)
             logger.warning("Unknown audit event type: %s", event_type)
 
-        entry_id = f"aud_{uuid.uuid4().hex[:12]}"
+        entry_id = f"aud_{secrets.token_hex(6)}"
 
+        _ensure_writer()
         try:
-            with db_connection() as conn:
-                conn.execute(
-                    """INSERT INTO audit_log
-                       (id, timestamp, event_type, actor, ip_address, endpoint,
-                        method, status_code, request_summary, metadata)
-                       VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-                    (
-                        entry_id,
-                        time.time(),
-                        event_type,
-                        actor,
-                        ip_address,
-                        endpoint,
-                        method,
-                        status_code,
-                        (request_summary or "")[:500],
-                        json.dumps(metadata) if metadata else None,
-                    ),
-                )
-                conn.commit()
-        except Exception as e:
-            # Don't let audit failures break the application
-            logger.error("Audit log failed: %s", e)
+            _audit_q.put_nowait((
+                entry_id,
+                time.time(),
+                event_type,
+                actor,
+                ip_address,
+                endpoint,
+                method,
+                status_code,
+                (request_summary or "")[:500],
+                dict(metadata) if metadata else None,  # encoded by the writer
+            ))
+        except queue.Full:
+            # Don't let audit backpressure block the application
+            logger.warning("Audit queue full — dropping %s event", event_type)
+
+    @staticmethod
+    def flush(timeout: float = 5.0) -> bool:
+        """Wait until every queued audit event has been written.
+
+        Returns False if events are still pending after ``timeout`` seconds.
+        """
+        deadline = time.monotonic() + timeout
+        with _audit_q.all_tasks_done:
+            while _audit_q.unfinished_tasks:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                _audit_q.all_tasks_done.wait(remaining)
+        return True
 
     @staticmethod
     def query(
@@ -125,22 +267,26 @@ class AuditLogger:
         where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
         params.append(limit)
 
+        # Include events logged just before this query
+        AuditLogger.flush(timeout=1.0)
+
         try:
-            with db_connection() as conn:
-                conn.row_factory = lambda c, r: dict(
-                    zip([col[0] for col in c.description], r)
-                )
+            with db_connection_row() as conn:
                 rows = conn.execute(
-                    f"""SELECT * FROM audit_log {where}
+                    f"""SELECT {_AUDIT_COLUMNS} FROM audit_log {where}
                         ORDER BY timestamp DESC LIMIT ?""",
                     params,
                 ).fetchall()
-                return rows
+                return [dict(r) for r in rows]
         except Exception as e:
             logger.error("Audit query failed: %s", e)
             return []
 
 
+# Write out anything still queued when the process exits
+atexit.register(AuditLogger.flush)
+
+
 # Module-level convenience function
 def audit(event_type: str, **kwargs):
     """Convenience function for logging audit events."""
@@ -5,6 +5,8 @@ Provides API key loading, verification dependency, readiness check,
 and shared input sanitization used across route modules.
 """
 
+import fcntl
+import functools
 import os
 import re as _re
 import html as _html
@@ -20,22 +22,50 @@ _API_KEY_PATH = Path(__file__).parent / ".moose_api_key"
 
 
 def _load_or_create_api_key() -> str:
-    if _API_KEY_PATH.exists():
-        return _API_KEY_PATH.read_text().strip()
-    key = secrets.token_urlsafe(32)
-    _API_KEY_PATH.write_text(key)
-    _API_KEY_PATH.chmod(0o600)
-    return key
+    """Read the persisted API key, generating it on first run.
+
+    One open + exclusive flock covers both cases, so concurrently starting
+    workers can't race each other into writing different keys. The file is
+    created 0600 up front rather than chmod'ed after the write.
+    """
+    fd = os.open(_API_KEY_PATH, os.O_RDWR | os.O_CREAT, 0o600)
+    with os.fdopen(fd, "r+b") as f:
+        fcntl.flock(f, fcntl.LOCK_EX)
+        data = f.read().strip()
+        if not data:
+            data = secrets.token_urlsafe(32).encode()
+            f.write(data)
+            f.flush()
+        return data.decode()
 
 
 MOOSE_API_KEY = os.environ.get("MOOSE_API_KEY") or _load_or_create_api_key()
+_API_KEY_BYTES = MOOSE_API_KEY.encode()
+
+# Header values that already passed compare_digest. Only accepted keys are
+# cached — caching rejections would hand brute-force attempts a fast path.
+_accepted_keys: set[str] = set()
+_ACCEPTED_KEYS_MAX = 8
+
+
+def set_api_key(new_key: str):
+    """Replace the in-memory API key (used by key rotation)."""
+    global MOOSE_API_KEY, _API_KEY_BYTES
+    MOOSE_API_KEY = new_key
+    _API_KEY_BYTES = new_key.encode()
+    _accepted_keys.clear()
 
 
 def verify_api_key(request: Request):
     """Dependency that checks for a valid API key in the X-API-Key header."""
     key = request.headers.get("x-api-key")
-    if not key or not secrets.compare_digest(key, MOOSE_API_KEY):
+    if key in _accepted_keys:
+        return
+    # Compare as bytes: UTF-8 is lossless, so non-ASCII input can never match
+    if not key or not secrets.compare_digest(key.encode(), _API_KEY_BYTES):
         raise HTTPException(status_code=401, detail="Invalid or missing API key")
+    if len(_accepted_keys) < _ACCEPTED_KEYS_MAX:
+        _accepted_keys.add(key)
 
 
 def require_ready(request: Request):
@@ -59,10 +89,26 @@ def get_core() -> AgentCore:
     return _app_ref.state.agent_core
 
 
+# Inputs up to this length are memoized (names, tones, search terms repeat a lot);
+# longer bodies are sanitized directly so the cache never pins large strings.
+_SANITIZE_CACHE_MAX_LEN = 256
+
+_TAG_RE = _re.compile(r"<[^>]+>")
+
+
+def _sanitize(text: str, max_length: int) -> str:
+    cleaned = _TAG_RE.sub("", text)
+    cleaned = _html.escape(cleaned)
+    return cleaned[:max_length]
+
+
+_sanitize_cached = functools.lru_cache(maxsize=1024)(_sanitize)
+
+
 def sanitize_input(text: str, max_length: int = 5000) -> str:
     """Strip HTML tags and enforce length limits on user input."""
     if not text:
         return ""
-    cleaned = _re.sub(r"<[^>]+>", "", text)
-    cleaned = _html.escape(cleaned)
-    return cleaned[:max_length]
+    if len(text) <= _SANITIZE_CACHE_MAX_LEN:
+        return _sanitize_cached(text, max_length)
+    return _sanitize(text, max_length)
@@ -10,17 +10,151 @@ Runs as an asyncio task from AgentCore.start().
 """
 
 import asyncio
+import hashlib
+import heapq
 import json
 import logging
+import os
+import re
 import time
-import uuid
+from collections import Counter, deque
+from contextlib import asynccontextmanager
 from datetime import datetime, timezone
+from itertools import chain, islice
 from typing import Optional
 
 from db import db_connection_row
+from tools_icp import persona_version
 
 logger = logging.getLogger(__name__)
 
+# Optional: orjson parses tool results faster than stdlib json
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Optional: Aho-Corasick automaton for persona term matching (pip install pyahocorasick)
+try:
+    import ahocorasick
+    HAS_AHOCORASICK = True
+except ImportError:
+    HAS_AHOCORASICK = False
+
+# Marketing observation in one round trip: (kind, status, count) rows.
+_SQL_MARKETING_STATS = """
+    SELECT 'email' AS kind, status, COUNT(*) AS c FROM marketing_emails GROUP BY status
+    UNION ALL
+    SELECT 'content', status, COUNT(*) FROM content_drafts GROUP BY status
+    UNION ALL
+    SELECT 'responses', NULL, COUNT(*) FROM outreach_attempts
+        WHERE status IN ('opened', 'replied') AND updated_at > :since
+"""
+
+# Briefing counters as a single row of scalar subqueries.
+_SQL_BRIEFING_STATS = """
+    SELECT
+        (SELECT COUNT(*) FROM content_drafts WHERE status = 'drafted') AS pending_content,
+        (SELECT COUNT(*) FROM content_drafts WHERE status = 'published' AND updated_at > :since) AS published_today,
+        (SELECT COUNT(*) FROM marketing_emails WHERE status = 'pending') AS pending_emails,
+        (SELECT COUNT(*) FROM outreach_attempts WHERE status = 'sent' AND updated_at > :since) AS sent_emails,
+        (SELECT COUNT(*) FROM outreach_attempts
+            WHERE status IN ('opened', 'replied') AND updated_at > :since) AS responses
+"""
+
+_SQL_MOLTBOOK_PUBLISHED = (
+    "SELECT id, platform_post_id FROM content_drafts"
+    " WHERE status = 'published' AND platform = 'moltbook' AND platform_post_id IS NOT NULL"
+    " ORDER BY updated_at DESC LIMIT 5"
+)
+
+_SQL_RECENT_TITLES = (
+    "SELECT title FROM content_drafts WHERE created_at > :since ORDER BY created_at DESC LIMIT 20"
+)
+
+_SQL_PERSONAS = "SELECT id, name, pain_points FROM icp_personas"
+
+
+def _build_persona_automaton(persona_tokens: list[tuple[str, str, tuple[str, ...]]]):
+    """Build an automaton mapping each term to the first persona that lists it,
+    or None when pyahocorasick is unavailable or there are no terms."""
+    if not HAS_AHOCORASICK:
+        return None
+    first_persona: dict[str, int] = {}
+    for idx, (_, _, terms) in enumerate(persona_tokens):
+        for term in terms:
+            first_persona.setdefault(term, idx)
+    if not first_persona:
+        return None
+    automaton = ahocorasick.Automaton()
+    for term, idx in first_persona.items():
+        automaton.add_word(term, idx)
+    automaton.make_automaton()
+    return automaton
+
+
+def _fetchall(conn, sql: str, params=()) -> list:
+    """Run a query and fetch all rows; called via asyncio.to_thread."""
+    return conn.execute(sql, params).fetchall()
+
+
+def _load_persona_tokens(conn=None) -> tuple[list[tuple[str, str, tuple[str, ...]]], object]:
+    """Read ICP personas and build their match terms and automaton (blocking).
+
+    Uses conn when given (the cycle connection), else opens a read-only one.
+    """
+    if conn is not None:
+        personas = _fetchall(conn, _SQL_PERSONAS)
+    else:
+        with db_connection_row(query_only=True) as own:
+            personas = _fetchall(own, _SQL_PERSONAS)
+    persona_tokens = []
+    for persona in personas:
+        pain = (persona["pain_points"] or "").lower()
+        terms = tuple(t for t in (term.strip() for term in pain.split(",")[:3]) if t)
+        persona_tokens.append((persona["id"], persona["name"], terms))
+    return persona_tokens, _build_persona_automaton(persona_tokens)
+
+
+# Insight types that become a user notification when someone is connected
+_NOTIFY_INSIGHT_TYPES = frozenset({"queue_alert", "engagement_signal"})
+
+# Insight types that map to exactly one action
+_INSIGHT_ACTIONS = {
+    "content_performance": "content_series",   # high-performance content → suggest more
+    "capability_gap": "create_proposal",       # capability gap → improvement proposal
+    "pattern": "store_pattern",                # pattern → store to memory
+}
+
+# Recurring-theme keywords for _detect_patterns, matched as substrings in one
+# pass. None is a substring of another, so per-keyword counts equal str.count.
+_PATTERN_KEYWORDS = ("breach", "privacy", "compliance", "security", "engagement", "outreach")
+_PATTERN_RE = re.compile("|".join(_PATTERN_KEYWORDS), re.IGNORECASE | re.ASCII)
+
+# cognitive_status frame with its constant keys pre-encoded; see _broadcast_status
+_STATUS_FRAME = (
+    '{{"type":"cognitive_status","phase":{phase},"cycle":{cycle},'
+    '"observations":{observations},"thoughts":{thoughts}}}'
+)
+
+# Briefing bodies, filled from the _SQL_BRIEFING_STATS columns plus loop counters
+_BRIEFING_TEMPLATES = {
+    "morning": (
+        "**Morning Briefing**\n\n"
+        "Content: {pending_content} drafts pending approval, {published_today} published in last 24h\n"
+        "Outreach: {pending_emails} emails pending, {sent_emails} sent, {responses} responses\n"
+        "Cognitive loop: {cycle_count} cycles completed, {thought_count} thoughts recorded"
+    ),
+    "evening": (
+        "**Evening Summary**\n\n"
+        "Today's activity: {published_today} pieces published, {sent_emails} emails sent\n"
+        "Engagement: {responses} responses received\n"
+        "Pending: {pending_content} content drafts, {pending_emails} emails awaiting approval\n"
+        "Cognitive loop: {cycle_count} total cycles"
+    ),
+}
+
 
 class CognitiveLoop:
     """Always-on OODA cognitive loop — the brain of the agent system."""
@@ -28,6 +162,15 @@ class CognitiveLoop:
     _MAX_THOUGHT_JOURNAL = 500     # Cap thought journal to prevent unbounded growth
     _MAX_CONTENT_ANGLES = 100      # Cap content angles
     _MAX_MEMORY_WRITES_PER_DAY = 50  # Cap memory writes to avoid polluting search
+    _PERSONA_TTL = 300             # Personas change rarely; re-read at most every 5 min
+    _MAX_DECIDE_INSIGHTS = 32      # Only the most urgent insights are turned into actions
+    _STATUS_COALESCE_SECONDS = 0.1  # Phase changes within this window share one status broadcast
+    _RECENT_TITLES_TTL = 60        # Draft titles are also updated in-process by _act_draft_content
+    _ID_BYTES = 6                  # 12 hex chars, 48 random bits per ID
+    _ID_POOL_BYTES = 64            # urandom bytes fetched per refill of the ID pool
+    _IDLE_BACKOFF_AFTER = 3        # Consecutive idle cycles before backoff starts
+    _IDLE_BACKOFF_STEPS = 5        # Backoff steps after which the interval stops growing
+    _MAX_IDLE_INTERVAL = 900       # Never sleep longer than 15 min between cycles
 
     def __init__(self, core):
         self._core = core
@@ -35,20 +178,33 @@ class CognitiveLoop:
         self.min_interval = 30          # accelerate when events are hot
         self.running = False
         self.cycle_count = 0
-        self.observations: list[dict] = []
-        self.thought_journal: list[dict] = []
-        self.content_angles: list[dict] = []
+        self.observations: list[dict] = []  # latest cycle only; replaced by _observe, never appended
+        # Bounded: the oldest entries are evicted on append once full
+        self.thought_journal: deque[dict] = deque(maxlen=self._MAX_THOUGHT_JOURNAL)
+        self.content_angles: deque[dict] = deque(maxlen=self._MAX_CONTENT_ANGLES)
         self._last_observation_time = 0.0
         self._last_reflection_time = 0.0
         self._reflection_every_n = 10   # reflect every N cycles
+        self._idle_streak = 0           # consecutive cycles with no insights and no actions
+        self._urgent_count = 0          # security flags seen by the last _obs_security
+        self._id_pool = b""             # unused urandom bytes for _new_id()
         self._morning_briefing_hour = 9
         self._evening_briefing_hour = 18
         self._last_briefing_date: Optional[str] = None
         self._last_briefing_type: Optional[str] = None
         self._phase = "idle"             # idle, observe, orient, decide, act
+        self._status_task: Optional[asyncio.Task] = None
+        self._last_broadcast_sig: Optional[tuple] = None  # (phase, cycle, observations, thoughts) last sent
         self._task: Optional[asyncio.Task] = None
+        self._wakeup = asyncio.Event()       # set by notify_urgent() to cut the sleep short
         self._memory_writes_today = 0
         self._memory_writes_reset_date: Optional[str] = None
+        self._today_str = time.strftime("%Y-%m-%d")  # local date, refreshed once per cycle
+        self._cycle_now_iso = datetime.now(timezone.utc).isoformat()  # UTC cycle start, ditto
+        self._persona_cache: tuple = (float("-inf"), -1, [], None)  # (fetched_at, version, tokens, automaton)
+        self._recent_titles_cache: tuple[float, set[str]] = (float("-inf"), set())  # (fetched_at, titles)
+        self._last_search_key: Optional[bytes] = None   # digest of the last searched observations
+        self._last_related_memories: list[dict] = []
 
     async def start(self):
         """Start the cognitive loop as a background task."""
@@ -67,12 +223,36 @@ class CognitiveLoop:
                 await self._task
             except asyncio.CancelledError:
                 pass
+        if self._status_task:
+            self._status_task.cancel()
         logger.info("[CognitiveLoop] Stopped")
 
     @property
     def phase(self) -> str:
         return self._phase
 
+    def notify_urgent(self):
+        """Start the next cycle now instead of after the current sleep."""
+        self._wakeup.set()
+
+    async def _sleep_until_woken(self, timeout: float):
+        """Sleep up to timeout seconds, returning early on notify_urgent()."""
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
+        self._wakeup.clear()
+
+    @asynccontextmanager
+    async def _cycle_conn(self):
+        """One read-only Row-factory connection shared by every DB read in a cycle.
+
+        Queries on it run in worker threads via asyncio.to_thread, one phase at
+        a time, so it is opened without the same-thread check.
+        """
+        with db_connection_row(query_only=True, check_same_thread=False) as conn:
+            yield conn
+
     # ── Main Loop ──
 
     async def _run_loop(self):
@@ -83,40 +263,42 @@ class CognitiveLoop:
         while self.running:
             try:
                 self.cycle_count += 1
+                self._today_str = time.strftime("%Y-%m-%d")
+                self._cycle_now_iso = datetime.now(timezone.utc).isoformat()
 
-                self._phase = "observe"
-                await self._broadcast_status()
-                observations = await self._observe()
+                async with self._cycle_conn() as conn:
+                    self._set_phase("observe")
+                    observations = await self._observe(conn)
 
-                self._phase = "orient"
-                await self._broadcast_status()
-                insights = await self._orient(observations)
+                    self._set_phase("orient")
+                    insights = await self._orient(observations, conn)
 
-                # Advocacy phase — pattern detection and goal tracking
-                self._phase = "advocate"
-                await self._broadcast_status()
-                await self._advocate(observations, insights)
+                    # Advocacy phase — pattern detection and goal tracking
+                    self._set_phase("advocate")
+                    await self._advocate(observations, insights)
 
-                self._phase = "decide"
-                await self._broadcast_status()
-                actions = await self._decide(insights)
+                    self._set_phase("decide")
+                    actions = await self._decide(insights, conn)
 
-                self._phase = "act"
-                await self._broadcast_status()
-                await self._act(actions)
+                    self._set_phase("act")
+                    await self._act(actions)
 
-                # Periodic reflection
-                if self.cycle_count % self._reflection_every_n == 0:
-                    await self._reflect()
+                    # Periodic reflection
+                    if self.cycle_count % self._reflection_every_n == 0:
+                        await self._reflect()
 
-                # Check scheduled briefings
-                await self._check_scheduled_briefings()
+                    # Check scheduled briefings
+                    await self._check_scheduled_briefings(conn)
 
-                self._phase = "idle"
-                await self._broadcast_status()
+                self._set_phase("idle")
+
+                if insights or actions:
+                    self._idle_streak = 0
+                else:
+                    self._idle_streak += 1
 
-                interval = self._adaptive_interval(observations)
-                await asyncio.sleep(interval)
+                interval = self._adaptive_interval(len(observations), self._urgent_count)
+                await self._sleep_until_woken(interval)
 
             except asyncio.CancelledError:
                 break
@@ -127,17 +309,54 @@ class CognitiveLoop:
 
     # ── OBSERVE Phase ──
 
-    async def _observe(self) -> list[dict]:
-        """Gather raw data from all subsystems."""
-        observations = []
+    async def _observe(self, conn) -> list[dict]:
+        """Gather raw data from all subsystems.
+
+        Observers run concurrently, so the phase takes as long as the slowest
+        network-bound one (model sync, Moltbook stats) rather than their sum.
+        Results keep observer order.
+        """
         now = time.time()
+        # Blocking reads run in a worker thread; only one thread uses conn at a time
+        try:
+            marketing_rows = await asyncio.to_thread(
+                _fetchall, conn, _SQL_MARKETING_STATS, {"since": now - 86400}
+            )
+        except Exception as e:
+            logger.warning("[CognitiveLoop] Marketing observe error: %s", e)
+            marketing_rows = None
+
+        results = await asyncio.gather(
+            self._obs_security(now),
+            self._obs_marketing(marketing_rows, now),
+            self._obs_channels(now),
+            self._obs_system(now),
+            self._obs_moltbook(conn, now),
+            self._obs_model_health(now),
+            return_exceptions=True,
+        )
+
+        observations = []
+        for result in results:
+            if isinstance(result, BaseException):
+                logger.warning("[CognitiveLoop] Observer error: %s", result)
+            else:
+                observations.extend(result)
+
+        self._last_observation_time = now
+        self.observations = observations
+        return observations
 
-        # 1. Security audit queue
+    async def _obs_security(self, now: float) -> list[dict]:
+        """Security audit queue and flags. Also records the flag count for _adaptive_interval."""
+        observations = []
+        self._urgent_count = 0
         try:
             security_agent = self._core.registry.get("security") if self._core.registry else None
             if security_agent:
                 queue, flags = security_agent.get_and_clear_audit_data()
                 if flags:
+                    self._urgent_count = len(flags)
                     for flag in flags:
                         observations.append({
                             "source": "security",
@@ -156,116 +375,103 @@ class CognitiveLoop:
                     })
         except Exception as e:
             logger.warning("[CognitiveLoop] Security observe error: %s", e)
+        return observations
 
-        # 2. Marketing stats
+    async def _obs_marketing(self, rows: Optional[list], now: float) -> list[dict]:
+        """Marketing stats, pivoted from _SQL_MARKETING_STATS rows."""
+        if rows is None:
+            return []
         try:
-            with db_connection_row() as conn:
-                # Email stats
-                email_rows = conn.execute(
-                    "SELECT status, COUNT(*) as c FROM marketing_emails GROUP BY status"
-                ).fetchall()
-                email_stats = {r["status"]: r["c"] for r in email_rows}
-
-                # Content stats
-                content_rows = conn.execute(
-                    "SELECT status, COUNT(*) as c FROM content_drafts GROUP BY status"
-                ).fetchall()
-                content_stats = {r["status"]: r["c"] for r in content_rows}
-
-                # Recent outreach responses
-                recent_outreach = conn.execute(
-                    "SELECT COUNT(*) as c FROM outreach_attempts WHERE status IN ('opened', 'replied') AND updated_at > ?",
-                    (now - 86400,)
-                ).fetchone()
-
-                # Pending content count
-                pending_content = conn.execute(
-                    "SELECT COUNT(*) as c FROM content_drafts WHERE status = 'drafted'"
-                ).fetchone()
-
-            observations.append({
+            # Email/content counts by status plus recent outreach responses
+            email_stats, content_stats, recent_responses = {}, {}, 0
+            for kind, status, count in rows:
+                if kind == "email":
+                    email_stats[status] = count
+                elif kind == "content":
+                    content_stats[status] = count
+                else:
+                    recent_responses = count
+
+            return [{
                 "source": "marketing",
                 "type": "stats",
                 "email_stats": email_stats,
                 "content_stats": content_stats,
-                "recent_responses": recent_outreach["c"] if recent_outreach else 0,
-                "pending_content": pending_content["c"] if pending_content else 0,
+                "recent_responses": recent_responses,
+                "pending_content": content_stats.get("drafted", 0),
                 "timestamp": now,
-            })
+            }]
         except Exception as e:
             logger.warning("[CognitiveLoop] Marketing observe error: %s", e)
+            return []
 
-        # 3. Channel messages since last observation
+    async def _obs_channels(self, now: float) -> list[dict]:
+        """Channel messages since last observation."""
         try:
             if self._core.channel_manager:
-                channels = self._core.channel_manager.get_all_channels()
-                new_messages = 0
-                for ch in channels:
-                    msgs = self._core.channel_manager.get_channel_messages(
-                        ch.get("name", ""), limit=10
-                    )
-                    for msg in msgs:
-                        msg_time = msg.get("timestamp", "")
-                        if msg_time and msg_time > datetime.fromtimestamp(
-                            self._last_observation_time, tz=timezone.utc
-                        ).isoformat():
-                            new_messages += 1
+                new_messages = self._core.channel_manager.count_messages_since(
+                    self._last_observation_time
+                )
                 if new_messages > 0:
-                    observations.append({
+                    return [{
                         "source": "channels",
                         "type": "new_messages",
                         "count": new_messages,
                         "timestamp": now,
-                    })
+                    }]
         except Exception as e:
             logger.warning("[CognitiveLoop] Channel observe error: %s", e)
+        return []
 
-        # 4. System health
+    async def _obs_system(self, now: float) -> list[dict]:
+        """System health."""
         try:
             active_tasks = sum(1 for t in self._core._tasks.values() if t.status == "running")
             memory_count = self._core.memory.count()
             ws_clients = len(self._core.ws_clients)
-            observations.append({
+            return [{
                 "source": "system",
                 "type": "health",
                 "active_tasks": active_tasks,
                 "memory_entries": memory_count,
                 "connected_clients": ws_clients,
                 "timestamp": now,
-            })
+            }]
         except Exception as e:
             logger.warning("[CognitiveLoop] System health observe error: %s", e)
+            return []
 
-        # 5. Moltbook engagement (if configured)
+    async def _obs_moltbook(self, conn, now: float) -> list[dict]:
+        """Moltbook engagement (if configured), fetching post stats concurrently."""
+        observations = []
         try:
             from integrations.moltbook import get_moltbook_client
             client = get_moltbook_client()
             if client and client.is_configured():
-                with db_connection_row() as conn:
-                    published = conn.execute(
-                        "SELECT id, platform_post_id FROM content_drafts WHERE status = 'published' AND platform = 'moltbook' AND platform_post_id IS NOT NULL ORDER BY updated_at DESC LIMIT 5"
-                    ).fetchall()
-                for post in published:
-                    if post["platform_post_id"]:
-                        try:
-                            stats = await client.get_post_stats(post["platform_post_id"])
-                            if stats:
-                                observations.append({
-                                    "source": "moltbook",
-                                    "type": "engagement",
-                                    "draft_id": post["id"],
-                                    "platform_post_id": post["platform_post_id"],
-                                    "stats": stats,
-                                    "timestamp": now,
-                                })
-                        except Exception:
-                            pass
+                rows = await asyncio.to_thread(_fetchall, conn, _SQL_MOLTBOOK_PUBLISHED)
+                published = [post for post in rows if post["platform_post_id"]]
+                stats_list = await asyncio.gather(
+                    *(client.get_post_stats(post["platform_post_id"]) for post in published),
+                    return_exceptions=True,
+                )
+                for post, stats in zip(published, stats_list):
+                    if stats and not isinstance(stats, BaseException):
+                        observations.append({
+                            "source": "moltbook",
+                            "type": "engagement",
+                            "draft_id": post["id"],
+                            "platform_post_id": post["platform_post_id"],
+                            "stats": stats,
+                            "timestamp": now,
+                        })
         except ImportError:
             pass
         except Exception as e:
             logger.warning("[CognitiveLoop] Moltbook observe error: %s", e)
+        return observations
 
-        # 6. Model & capability health
+    async def _obs_model_health(self, now: float) -> list[dict]:
+        """Model & capability health."""
         try:
             if self._core.model_manager:
                 # Re-sync with backend to detect external unloads
@@ -279,7 +485,7 @@ class CognitiveLoop:
                 task_failures = sum(
                     1 for t in self._core._tasks.values() if t.status == "failed"
                 )
-                observations.append({
+                return [{
                     "source": "system",
                     "type": "model_health",
                     "loaded": loaded,
@@ -287,39 +493,58 @@ class CognitiveLoop:
                     "failed_loads": failed_loads,
                     "task_failures": task_failures,
                     "timestamp": now,
-                })
+                }]
         except Exception as e:
             logger.warning("[CognitiveLoop] Model health observe error: %s", e)
-
-        self._last_observation_time = now
-        self.observations = observations
-        return observations
+        return []
 
     # ── ORIENT Phase ──
 
-    async def _orient(self, observations: list[dict]) -> list[dict]:
+    async def _orient(self, observations: list[dict], conn=None) -> list[dict]:
         """Process observations, identify patterns and content angles."""
         insights = []
 
         if not observations:
             return insights
 
+        # One pass over the observations: partition them by (source, type) and
+        # pull out the columns the helpers below need, instead of each helper
+        # re-reading the same fields from every dict
+        buckets: dict[tuple[str, str], list[dict]] = {}
+        summaries: list[str] = []
+        non_health: list[dict] = []
+        for o in observations:
+            obs_type = o["type"]
+            buckets.setdefault((o["source"], obs_type), []).append(o)
+            summaries.append(o.get("summary", ""))
+            if obs_type != "health":
+                non_health.append(o)
+
         # Summarize observations
         obs_summary = self._summarize_observations(observations)
 
-        # Search memory for related past observations
+        # Search memory for related past observations — reusing the last results
+        # when nothing but system health changed since that search
         related_memories = []
         if self._core.memory._api_base and obs_summary:
-            try:
-                related_memories = await self._core.memory.search(
-                    obs_summary[:500], top_k=5
-                )
-            except Exception as e:
-                logger.warning("[CognitiveLoop] Memory search error: %s", e)
+            search_key = hashlib.blake2b(
+                self._summarize_observations(non_health).encode(),
+                digest_size=8,
+            ).digest()
+            if search_key == self._last_search_key:
+                related_memories = self._last_related_memories
+            else:
+                try:
+                    related_memories = await self._core.memory.search(
+                        obs_summary[:500], top_k=5
+                    )
+                    self._last_search_key = search_key
+                    self._last_related_memories = related_memories
+                except Exception as e:
+                    logger.warning("[CognitiveLoop] Memory search error: %s", e)
 
         # Identify content angles from security events
-        security_obs = [o for o in observations if o["source"] == "security" and o["type"] == "security_flag"]
-        for sec in security_obs:
+        for sec in buckets.get(("security", "security_flag"), ()):
             insights.append({
                 "type": "content_angle",
                 "source": "security",
@@ -330,8 +555,7 @@ class CognitiveLoop:
             })
 
         # Identify content angles from marketing stats
-        marketing_obs = [o for o in observations if o["source"] == "marketing" and o["type"] == "stats"]
-        for mkt in marketing_obs:
+        for mkt in buckets.get(("marketing", "stats"), ()):
             responses = mkt.get("recent_responses", 0)
             if responses > 0:
                 insights.append({
@@ -350,8 +574,7 @@ class CognitiveLoop:
                 })
 
         # Identify engagement patterns from Moltbook
-        engagement_obs = [o for o in observations if o["source"] == "moltbook" and o["type"] == "engagement"]
-        for eng in engagement_obs:
+        for eng in buckets.get(("moltbook", "engagement"), ()):
             stats = eng.get("stats", {})
             views = stats.get("views", 0)
             if views > 100:
@@ -365,23 +588,18 @@ class CognitiveLoop:
 
         # Match insights to ICP personas
         try:
-            with db_connection_row() as conn:
-                personas = conn.execute("SELECT id, name, pain_points, preferred_platforms FROM icp_personas").fetchall()
+            await self._get_persona_tokens(conn)
             for insight in insights:
                 if insight["type"] == "content_angle":
-                    summary_lower = insight.get("summary", "").lower()
-                    for persona in personas:
-                        pain = (persona["pain_points"] or "").lower()
-                        if any(term in summary_lower for term in pain.split(",")[:3] if term.strip()):
-                            insight["matched_persona_id"] = persona["id"]
-                            insight["matched_persona_name"] = persona["name"]
-                            break
+                    persona = self._first_matching_persona(insight.get("summary", "").lower())
+                    if persona:
+                        insight["matched_persona_id"] = persona[0]
+                        insight["matched_persona_name"] = persona[1]
         except Exception as e:
             logger.warning("[CognitiveLoop] Persona matching error: %s", e)
 
         # Detect capability gaps from model health
-        model_health_obs = [o for o in observations if o.get("type") == "model_health"]
-        for mh in model_health_obs:
+        for mh in buckets.get(("system", "model_health"), ()):
             # Failed always-loaded models → high severity gap
             for failed_key in mh.get("failed_loads", []):
                 insights.append({
@@ -409,7 +627,7 @@ class CognitiveLoop:
         # Detect patterns from memory
         if related_memories:
             memory_texts = [m.get("text", "") for m in related_memories]
-            pattern_hint = self._detect_patterns(memory_texts, observations)
+            pattern_hint = self._detect_patterns(memory_texts, summaries)
             if pattern_hint:
                 insights.append({
                     "type": "pattern",
@@ -435,15 +653,15 @@ class CognitiveLoop:
 
     # ── DECIDE Phase ──
 
-    async def _decide(self, insights: list[dict]) -> list[dict]:
+    async def _decide(self, insights: list[dict], conn) -> list[dict]:
         """Rank insights, filter, and route to actions."""
         actions = []
 
         if not insights:
             return actions
 
-        # Sort by urgency
-        insights.sort(key=lambda x: x.get("urgency", 0), reverse=True)
+        # Most urgent first, capped (nlargest matches a stable descending sort)
+        insights = heapq.nlargest(self._MAX_DECIDE_INSIGHTS, insights, key=lambda x: x.get("urgency", 0))
 
         # Check user presence
         user_present = len(self._core.ws_clients) > 0
@@ -451,20 +669,16 @@ class CognitiveLoop:
         # Deduplicate against recent content
         recent_titles = set()
         try:
-            with db_connection_row() as conn:
-                recent = conn.execute(
-                    "SELECT title FROM content_drafts WHERE created_at > ? ORDER BY created_at DESC LIMIT 20",
-                    (time.time() - 86400,)
-                ).fetchall()
-                recent_titles = {r["title"].lower() for r in recent if r["title"]}
+            recent_titles = await self._get_recent_titles(conn)
         except Exception:
             pass
 
         for insight in insights:
             urgency = insight.get("urgency", 0)
+            insight_type = insight["type"]
 
-            # Content angle → draft content
-            if insight["type"] == "content_angle":
+            if insight_type == "content_angle":
+                # Content angle → draft content
                 suggestion = insight.get("content_suggestion", "")
                 if suggestion and suggestion.lower() not in recent_titles:
                     actions.append({
@@ -480,50 +694,27 @@ class CognitiveLoop:
                             "urgency": urgency,
                         })
 
-            # Queue alerts
-            if insight["type"] == "queue_alert" and user_present:
-                actions.append({
-                    "action": "notify_user",
-                    "insight": insight,
-                    "urgency": urgency,
-                })
-
-            # Engagement signals
-            if insight["type"] == "engagement_signal" and user_present:
-                actions.append({
-                    "action": "notify_user",
-                    "insight": insight,
-                    "urgency": urgency,
-                })
-
-            # High-performance content → suggest more
-            if insight["type"] == "content_performance":
-                actions.append({
-                    "action": "content_series",
-                    "insight": insight,
-                    "urgency": urgency,
-                })
-
-            # Capability gaps → create improvement proposal
-            if insight["type"] == "capability_gap":
-                actions.append({
-                    "action": "create_proposal",
-                    "insight": insight,
-                    "urgency": urgency,
-                })
+                # Urgent security → immediate notification
+                if insight["source"] == "security" and urgency > 0.8:
+                    actions.append({
+                        "action": "urgent_notify",
+                        "insight": insight,
+                        "urgency": urgency,
+                    })
 
-            # Patterns → store to memory
-            if insight["type"] == "pattern":
-                actions.append({
-                    "action": "store_pattern",
-                    "insight": insight,
-                    "urgency": urgency,
-                })
+            # Queue alerts and engagement signals → notify a present user
+            elif insight_type in _NOTIFY_INSIGHT_TYPES:
+                if user_present:
+                    actions.append({
+                        "action": "notify_user",
+                        "insight": insight,
+                        "urgency": urgency,
+                    })
 
-            # Urgent security → immediate notification
-            if insight["type"] == "content_angle" and insight["source"] == "security" and urgency > 0.8:
+            # One action per remaining insight type
+            elif insight_type in _INSIGHT_ACTIONS:
                 actions.append({
-                    "action": "urgent_notify",
+                    "action": _INSIGHT_ACTIONS[insight_type],
                     "insight": insight,
                     "urgency": urgency,
                 })
@@ -532,16 +723,9 @@ class CognitiveLoop:
 
     # ── ACT Phase ──
 
-    def _cap_collections(self):
-        """Enforce size caps on in-memory collections."""
-        if len(self.thought_journal) > self._MAX_THOUGHT_JOURNAL:
-            self.thought_journal = self.thought_journal[-self._MAX_THOUGHT_JOURNAL:]
-        if len(self.content_angles) > self._MAX_CONTENT_ANGLES:
-            self.content_angles = self.content_angles[-self._MAX_CONTENT_ANGLES:]
-
     def _can_write_memory(self) -> bool:
         """Check if we're under the daily memory write cap."""
-        today = datetime.now().strftime("%Y-%m-%d")
+        today = self._today_str
         if self._memory_writes_reset_date != today:
             self._memory_writes_today = 0
             self._memory_writes_reset_date = today
@@ -553,33 +737,11 @@ class CognitiveLoop:
 
     async def _act(self, actions: list[dict]):
         """Execute actions across all subsystems."""
-        self._cap_collections()
         for action in actions:
             try:
-                action_type = action["action"]
-                insight = action.get("insight", {})
-
-                if action_type == "draft_content":
-                    await self._act_draft_content(insight)
-
-                elif action_type == "draft_outreach":
-                    await self._act_draft_outreach(insight)
-
-                elif action_type == "notify_user":
-                    await self._act_notify_user(insight)
-
-                elif action_type == "urgent_notify":
-                    await self._act_urgent_notify(insight)
-
-                elif action_type == "store_pattern":
-                    await self._act_store_pattern(insight)
-
-                elif action_type == "content_series":
-                    await self._act_content_series(insight)
-
-                elif action_type == "create_proposal":
-                    await self._act_create_proposal(insight)
-
+                handler = self._ACTION_DISPATCH.get(action["action"])
+                if handler:
+                    await handler(self, action.get("insight", {}))
             except Exception as e:
                 logger.warning("[CognitiveLoop] Action error (%s): %s", action.get("action"), e)
 
@@ -602,7 +764,7 @@ class CognitiveLoop:
             tags="cognitive_loop,auto_drafted",
         )
 
-        result_data = json.loads(result)
+        result_data = orjson.loads(result) if HAS_ORJSON else json.loads(result)
         draft_id = result_data.get("draft_id")
 
         if draft_id:
@@ -614,6 +776,9 @@ class CognitiveLoop:
                 "source": "cognitive_loop",
             })
 
+            # Keep the cached dedup set current until its next refresh
+            self._recent_titles_cache[1].add(suggestion[:200].lower())
+
             # Record in thought journal
             self.thought_journal.append({
                 "type": "content_drafted",
@@ -760,6 +925,17 @@ class CognitiveLoop:
         logger.info("[CognitiveLoop] Created proposal %s: %s → %s",
                      proposal.id, gap_desc, solution.get("solution_type", ""))
 
+    # Action name → handler, called as handler(self, insight)
+    _ACTION_DISPATCH = {
+        "draft_content": _act_draft_content,
+        "draft_outreach": _act_draft_outreach,
+        "notify_user": _act_notify_user,
+        "urgent_notify": _act_urgent_notify,
+        "store_pattern": _act_store_pattern,
+        "content_series": _act_content_series,
+        "create_proposal": _act_create_proposal,
+    }
+
     # ── Reflection ──
 
     async def _reflect(self):
@@ -787,7 +963,7 @@ class CognitiveLoop:
         # Build reflection summary from thought journal
         journal_summary = ""
         if self.thought_journal:
-            recent_thoughts = self.thought_journal[-20:]
+            recent_thoughts = list(islice(reversed(self.thought_journal), 20))[::-1]
             types = {}
             for t in recent_thoughts:
                 types[t["type"]] = types.get(t["type"], 0) + 1
@@ -825,85 +1001,45 @@ class CognitiveLoop:
 
     # ── Scheduled Briefings ──
 
-    async def _check_scheduled_briefings(self):
+    async def _check_scheduled_briefings(self, conn):
         """Check if a morning or evening briefing is due."""
-        now = datetime.now()
-        today = now.strftime("%Y-%m-%d")
-        hour = now.hour
+        today = self._today_str
+        hour = time.localtime().tm_hour
 
         # Morning briefing
         if hour >= self._morning_briefing_hour and (
             self._last_briefing_date != today or self._last_briefing_type != "morning"
         ):
             if self._last_briefing_date != today:
-                await self._generate_briefing("morning")
+                await self._generate_briefing("morning", conn)
                 self._last_briefing_date = today
                 self._last_briefing_type = "morning"
 
         # Evening briefing
         elif hour >= self._evening_briefing_hour and self._last_briefing_type == "morning":
-            await self._generate_briefing("evening")
+            await self._generate_briefing("evening", conn)
             self._last_briefing_type = "evening"
 
-    async def _generate_briefing(self, briefing_type: str):
+    async def _generate_briefing(self, briefing_type: str, conn):
         """Generate and broadcast a scheduled briefing."""
         now = time.time()
 
         # Gather briefing data
         try:
-            with db_connection_row() as conn:
-                # Pending content
-                pending_content = conn.execute(
-                    "SELECT COUNT(*) as c FROM content_drafts WHERE status = 'drafted'"
-                ).fetchone()["c"]
-
-                # Published today
-                published_today = conn.execute(
-                    "SELECT COUNT(*) as c FROM content_drafts WHERE status = 'published' AND updated_at > ?",
-                    (now - 86400,)
-                ).fetchone()["c"]
-
-                # Email stats
-                pending_emails = conn.execute(
-                    "SELECT COUNT(*) as c FROM marketing_emails WHERE status = 'pending'"
-                ).fetchone()["c"]
-
-                sent_emails = conn.execute(
-                    "SELECT COUNT(*) as c FROM outreach_attempts WHERE status = 'sent' AND updated_at > ?",
-                    (now - 86400,)
-                ).fetchone()["c"]
-
-                # Responses
-                responses = conn.execute(
-                    "SELECT COUNT(*) as c FROM outreach_attempts WHERE status IN ('opened', 'replied') AND updated_at > ?",
-                    (now - 86400,)
-                ).fetchone()["c"]
-
+            rows = await asyncio.to_thread(_fetchall, conn, _SQL_BRIEFING_STATS, {"since": now - 86400})
+            stats = dict(rows[0], cycle_count=self.cycle_count, thought_count=len(self.thought_journal))
         except Exception as e:
             logger.warning("[CognitiveLoop] Briefing data error: %s", e)
             return
 
-        if briefing_type == "morning":
-            content = (
-                f"**Morning Briefing**\n\n"
-                f"Content: {pending_content} drafts pending approval, {published_today} published in last 24h\n"
-                f"Outreach: {pending_emails} emails pending, {sent_emails} sent, {responses} responses\n"
-                f"Cognitive loop: {self.cycle_count} cycles completed, {len(self.thought_journal)} thoughts recorded"
-            )
-        else:
-            content = (
-                f"**Evening Summary**\n\n"
-                f"Today's activity: {published_today} pieces published, {sent_emails} emails sent\n"
-                f"Engagement: {responses} responses received\n"
-                f"Pending: {pending_content} content drafts, {pending_emails} emails awaiting approval\n"
-                f"Cognitive loop: {self.cycle_count} total cycles"
-            )
+        # Anything but the morning briefing renders as the evening summary
+        content = _BRIEFING_TEMPLATES.get(briefing_type, _BRIEFING_TEMPLATES["evening"]).format_map(stats)
 
         # Store as briefing
         briefing = {
-            "id": str(uuid.uuid4())[:12],
+            "id": self._new_id(),
             "content": content,
-            "created_at": datetime.now(timezone.utc).isoformat(),
+            "created_at": self._cycle_now_iso,
             "read": False,
             "briefing_type": briefing_type,
         }
@@ -918,22 +1054,65 @@ class CognitiveLoop:
 
     # ── Helpers ──
 
-    def _adaptive_interval(self, observations: list[dict]) -> float:
-        """Shorten interval when there's more activity."""
-        if not observations:
-            return self.cycle_interval
+    async def _get_persona_tokens(self, conn=None, ttl: float = _PERSONA_TTL) -> list[tuple[str, str, tuple[str, ...]]]:
+        """(persona_id, name, match terms) per ICP persona, where the terms are the
+        first three lowercased pain points. Re-read (on conn, if given) when older
+        than ttl or after a persona write."""
+        fetched_at, version, persona_tokens, _ = self._persona_cache
+        now = time.monotonic()
+        current = persona_version()
+        if now - fetched_at < ttl and version == current:
+            return persona_tokens
+        persona_tokens, automaton = await asyncio.to_thread(_load_persona_tokens, conn)
+        self._persona_cache = (now, current, persona_tokens, automaton)
+        return persona_tokens
+
+    def _first_matching_persona(self, summary_lower: str) -> Optional[tuple[str, str, tuple[str, ...]]]:
+        """Return the first cached persona (in table order) with a term found in
+        summary_lower. Call _get_persona_tokens() first to refresh the cache."""
+        _, _, persona_tokens, automaton = self._persona_cache
+        if automaton is not None:
+            idx = min((i for _, i in automaton.iter(summary_lower)), default=None)
+            return persona_tokens[idx] if idx is not None else None
+        for persona in persona_tokens:
+            if any(term in summary_lower for term in persona[2]):
+                return persona
+        return None
 
-        # Count high-urgency items
-        urgent_count = sum(
-            1 for o in observations
-            if o.get("source") == "security" and o.get("type") == "security_flag"
+    async def _get_recent_titles(self, conn, ttl: float = _RECENT_TITLES_TTL) -> set[str]:
+        """Lowercased titles of the last day's drafts, re-read when older than ttl."""
+        fetched_at, titles = self._recent_titles_cache
+        now = time.monotonic()
+        if now - fetched_at < ttl:
+            return titles
+        recent = await asyncio.to_thread(
+            _fetchall, conn, _SQL_RECENT_TITLES, {"since": time.time() - 86400}
         )
-
-        # More active system → shorter intervals
-        total = len(observations)
+        titles = {r["title"].lower() for r in recent if r["title"]}
+        self._recent_titles_cache = (now, titles)
+        return titles
+
+    def _adaptive_interval(self, total: int, urgent_count: int) -> float:
+        """Shorten interval when there's more activity, back off while idle.
+
+        total is the cycle's observation count and urgent_count its security
+        flags (tallied by _obs_security). Once _IDLE_BACKOFF_AFTER consecutive
+        cycles have produced neither insights nor actions, the interval grows
+        by 1.5x per further idle cycle (capped), so borderline observation
+        counts don't flip the loop between fast and slow every cycle. Urgent
+        events still arrive promptly via notify_urgent().
+        """
+        # Security flags are counted as they are observed, so no rescan here
         if urgent_count > 0:
             return self.min_interval
-        elif total > 5:
+
+        if self._idle_streak >= self._IDLE_BACKOFF_AFTER:
+            steps = self._idle_streak - self._IDLE_BACKOFF_AFTER + 1
+            backoff = 1.5 ** min(steps, self._IDLE_BACKOFF_STEPS)
+            return min(self.cycle_interval * backoff, self._MAX_IDLE_INTERVAL)
+
+        # More active system → shorter intervals
+        if total > 5:
             return max(self.min_interval, self.cycle_interval // 2)
         else:
             return self.cycle_interval
@@ -941,40 +1120,72 @@ class CognitiveLoop:
     def _summarize_observations(self, observations: list[dict]) -> str:
         """Create a text summary of current observations."""
         parts = []
-        for obs in observations[:10]:
-            source = obs.get("source", "unknown")
-            obs_type = obs.get("type", "unknown")
-            summary = obs.get("summary", "")
+        for obs in islice(observations, 10):
+            obs_get = obs.get
+            source = obs_get("source", "unknown")
+            obs_type = obs_get("type", "unknown")
+            summary = obs_get("summary", "")
             if summary:
                 parts.append(f"[{source}/{obs_type}] {summary}")
             elif obs_type == "stats":
                 parts.append(f"[{source}] stats update")
             elif obs_type == "health":
-                parts.append(f"[system] {obs.get('active_tasks', 0)} active tasks, {obs.get('memory_entries', 0)} memories")
+                parts.append(f"[system] {obs_get('active_tasks', 0)} active tasks, {obs_get('memory_entries', 0)} memories")
         return "; ".join(parts)
 
-    def _detect_patterns(self, memory_texts: list[str], observations: list[dict]) -> Optional[str]:
-        """Simple keyword-based pattern detection across memory and observations."""
+    def _detect_patterns(self, memory_texts: list[str], summaries: list[str]) -> Optional[str]:
+        """Simple keyword-based pattern detection across memory and observation summaries."""
         # Count recurring terms across memory and observations
-        all_text = " ".join(memory_texts + [o.get("summary", "") for o in observations]).lower()
+        all_text = " ".join(chain(memory_texts, summaries))
 
-        keywords = ["breach", "privacy", "compliance", "security", "engagement", "outreach"]
-        found = [k for k in keywords if all_text.count(k) >= 2]
+        counts = Counter(m.lower() for m in _PATTERN_RE.findall(all_text))
+        found = [k for k in _PATTERN_KEYWORDS if counts[k] >= 2]
 
         if found:
             return f"Recurring themes detected: {', '.join(found)}"
         return None
 
+    def _new_id(self) -> str:
+        """Short random hex ID, sliced from a pooled os.urandom() read."""
+        if len(self._id_pool) < self._ID_BYTES:
+            self._id_pool = os.urandom(self._ID_POOL_BYTES)
+        chunk, self._id_pool = self._id_pool[:self._ID_BYTES], self._id_pool[self._ID_BYTES:]
+        return chunk.hex()
+
+    def _set_phase(self, phase: str):
+        """Enter a phase and schedule a coalesced status broadcast.
+
+        Phases that pass within _STATUS_COALESCE_SECONDS share one broadcast
+        of the latest phase, so fast cycles don't fan out six status messages.
+        """
+        self._phase = phase
+        if self._status_task is None or self._status_task.done():
+            self._status_task = asyncio.create_task(self._flush_status())
+
+    async def _flush_status(self):
+        """Broadcast the current phase after the coalescing window.
+
+        _set_phase won't schedule another flush while this one is awaiting a
+        send, so keep going until the latest status has actually gone out.
+        """
+        await asyncio.sleep(self._STATUS_COALESCE_SECONDS)
+        while self._status_sig() != self._last_broadcast_sig:
+            await self._broadcast_status()
+
+    def _status_sig(self) -> tuple:
+        return (self._phase, self.cycle_count, len(self.observations), len(self.thought_journal))
+
     async def _broadcast_status(self):
-        """Broadcast current cognitive loop phase to UI."""
+        """Broadcast current cognitive loop phase to UI, skipping exact repeats."""
+        sig = self._status_sig()
+        if sig == self._last_broadcast_sig:
+            return
+        self._last_broadcast_sig = sig
+        phase, cycle, observations, thoughts = sig
         try:
-            await self._core.broadcast({
-                "type": "cognitive_status",
-                "phase": self._phase,
-                "cycle": self.cycle_count,
-                "observations": len(self.observations),
-                "thoughts": len(self.thought_journal),
-            })
+            await self._core.broadcast_text(_STATUS_FRAME.format(
+                phase=json.dumps(phase), cycle=cycle, observations=observations, thoughts=thoughts,
+            ))
         except Exception:
             pass
 
@@ -988,4 +1199,5 @@ class CognitiveLoop:
             "thought_journal_size": len(self.thought_journal),
             "content_angles": len(self.content_angles),
             "cycle_interval": self.cycle_interval,
+            "idle_streak": self._idle_streak,
         }
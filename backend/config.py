@@ -5,6 +5,7 @@ Execution limits and internal constants remain as code constants.
 """
 
 import os
+from functools import cache as _cache
 from pathlib import Path as _Path
 
 from profile import get_profile
@@ -24,14 +25,17 @@ MODEL_LABELS = {}
 MODEL_VRAM_GB = {}
 MODEL_TIERS = {}  # model_key -> "always_loaded" | "on_demand"
 
-_model_map = {
-    "hermes": _profile.inference.models.primary,
-    "conversational": _profile.inference.models.conversational,
-    "orchestrator": _profile.inference.models.orchestrator,
-    "classifier": _profile.inference.models.classifier,
-    "security": _profile.inference.models.security,
-    "embedder": _profile.inference.models.embedder,
-}
+# model key -> attribute of profile.inference.models
+_MODEL_ATTRS = (
+    ("hermes", "primary"),
+    ("conversational", "conversational"),
+    ("orchestrator", "orchestrator"),
+    ("classifier", "classifier"),
+    ("security", "security"),
+    ("embedder", "embedder"),
+)
+_models_cfg = _profile.inference.models
+_model_map = {key: getattr(_models_cfg, attr) for key, attr in _MODEL_ATTRS}
 for key, mcfg in _model_map.items():
     if mcfg.model_id:
         MODELS[key] = mcfg.model_id
@@ -41,36 +45,32 @@ for key, mcfg in _model_map.items():
             MODEL_VRAM_GB[key] = mcfg.vram_gb
 
 # ── Memory Strategy (dynamic — derived from profile tier settings) ──
-ALWAYS_LOADED_MODELS = {k for k, t in MODEL_TIERS.items() if t == "always_loaded"}
-MANAGED_MODELS = {k for k, t in MODEL_TIERS.items() if t == "on_demand"}
-LARGE_MODELS = {k for k in MANAGED_MODELS if MODEL_VRAM_GB.get(k, 0) > 20}
+ALWAYS_LOADED_MODELS = frozenset(k for k, t in MODEL_TIERS.items() if t == "always_loaded")
+MANAGED_MODELS = frozenset(k for k, t in MODEL_TIERS.items() if t == "on_demand")
+LARGE_MODELS = frozenset(k for k in MANAGED_MODELS if MODEL_VRAM_GB.get(k, 0) > 20)
 
 # ── Execution Limits (code constants — not user config) ──
 DEFAULT_TIMEOUT = 300
 MAX_TOOL_ROUNDS = 8
 MAX_SECURITY_CONSULTATIONS = 5
 
-# ── Token Limits per model ──
-TOKEN_LIMITS = {
-    "hermes": _profile.inference.models.primary.max_tokens or 4096,
-    "conversational": _profile.inference.models.conversational.max_tokens or 2048,
-    "orchestrator": _profile.inference.models.orchestrator.max_tokens or 1024,
-    "classifier": _profile.inference.models.classifier.max_tokens or 10,
-    "security": _profile.inference.models.security.max_tokens or 4096,
-    "planner": 4096,
-    "default": 2048,
-}
-
-# ── Temperature defaults ──
-TEMPERATURE = {
-    "hermes": _profile.inference.models.primary.temperature or 0.7,
-    "conversational": _profile.inference.models.conversational.temperature or 0.7,
-    "orchestrator": _profile.inference.models.orchestrator.temperature or 0.3,
-    "classifier": _profile.inference.models.classifier.temperature or 0.1,
-    "security": _profile.inference.models.security.temperature or 0.3,
-    "planner": 0.3,
-    "default": 0.7,
+# ── Token Limits and Temperatures per model ──
+# (max_tokens, temperature) used when the profile leaves a model's value unset
+_MODEL_DEFAULTS = {
+    "hermes": (4096, 0.7),
+    "conversational": (2048, 0.7),
+    "orchestrator": (1024, 0.3),
+    "classifier": (10, 0.1),
+    "security": (4096, 0.3),
 }
+TOKEN_LIMITS = {}
+TEMPERATURE = {}
+for key, (default_tokens, default_temp) in _MODEL_DEFAULTS.items():
+    mcfg = _model_map[key]
+    TOKEN_LIMITS[key] = mcfg.max_tokens or default_tokens
+    TEMPERATURE[key] = mcfg.temperature or default_temp
+TOKEN_LIMITS.update({"planner": 4096, "default": 2048})
+TEMPERATURE.update({"planner": 0.3, "default": 0.7})
 
 # ── Context Window ──
 CONTEXT_WINDOW_SIZE = 6
@@ -95,15 +95,18 @@ FRICTION_PATH = ADVOCACY_STATE_DIR / "friction.json"
 ONBOARDING_PATH = ADVOCACY_STATE_DIR / "onboarding.json"
 
 # ── SMTP Configuration from profile ──
-SMTP_HOST = os.environ.get("MOOSE_SMTP_HOST", _profile.smtp.host)
-SMTP_PORT = int(os.environ.get("MOOSE_SMTP_PORT", str(_profile.smtp.port)))
-SMTP_USER = os.environ.get("MOOSE_SMTP_USER", _profile.smtp.user)
-SMTP_PASSWORD = os.environ.get("MOOSE_SMTP_PASSWORD", _profile.smtp.password)
-SMTP_FROM_NAME = os.environ.get("MOOSE_SMTP_FROM_NAME", _profile.smtp.from_name)
-SMTP_FROM_EMAIL = os.environ.get("MOOSE_SMTP_FROM_EMAIL", _profile.smtp.from_email)
-SMTP_USE_TLS = _profile.smtp.use_tls
-SMTP_ENABLED = _profile.smtp.enabled or os.environ.get("MOOSE_SMTP_ENABLED", "false").lower() == "true"
-SMTP_SENDS_PER_MINUTE = _profile.smtp.sends_per_minute
+# Environment overrides win when set and non-empty
+_smtp = _profile.smtp
+_env = os.environ.get
+SMTP_HOST = _env("MOOSE_SMTP_HOST") or _smtp.host
+SMTP_PORT = int(_env("MOOSE_SMTP_PORT") or _smtp.port)
+SMTP_USER = _env("MOOSE_SMTP_USER") or _smtp.user
+SMTP_PASSWORD = _env("MOOSE_SMTP_PASSWORD") or _smtp.password
+SMTP_FROM_NAME = _env("MOOSE_SMTP_FROM_NAME") or _smtp.from_name
+SMTP_FROM_EMAIL = _env("MOOSE_SMTP_FROM_EMAIL") or _smtp.from_email
+SMTP_USE_TLS = _smtp.use_tls
+SMTP_ENABLED = _smtp.enabled or (_env("MOOSE_SMTP_ENABLED") or "").lower() == "true"
+SMTP_SENDS_PER_MINUTE = _smtp.sends_per_minute
 
 # ── Agent Definitions (dynamic — only enabled agents) ──
 ESCALATION_CONFIG = {
@@ -124,6 +127,9 @@ ESCALATION_CONFIG = {
     },
 }
 
+# CRM agents are toggled by the CRM plugin rather than profile.agents
+_CRM_AGENTS = frozenset({"outreach", "content"})
+
 # Base agent definitions — full catalog
 _ALL_AGENT_DEFINITIONS = {
     "hermes": {
@@ -197,16 +203,16 @@ _ALL_AGENT_DEFINITIONS = {
     },
 }
 
-# Dynamic: only include agents where profile.agents.<key>.enabled is true
-# Outreach and content agents are included when the CRM plugin is enabled
-AGENT_DEFINITIONS = {}
-for agent_id, defn in _ALL_AGENT_DEFINITIONS.items():
-    if agent_id in ("outreach", "content"):
-        # CRM agents: only if CRM plugin is enabled
-        if _profile.plugins.crm.enabled:
-            AGENT_DEFINITIONS[agent_id] = defn
-    elif _profile.is_agent_enabled(agent_id):
-        AGENT_DEFINITIONS[agent_id] = defn
+
+@_cache
+def get_agent_definitions() -> dict:
+    """Only agents where profile.agents.<key>.enabled is true.
+    Outreach and content agents are included when the CRM plugin is enabled."""
+    enabled = frozenset(_profile.get_enabled_agents())
+    if _profile.plugins.crm.enabled:
+        enabled |= _CRM_AGENTS
+    return {agent_id: defn for agent_id, defn in _ALL_AGENT_DEFINITIONS.items() if agent_id in enabled}
+
 
 # ── Per-Agent Tool Filtering ──
 AGENT_TOOL_FILTER = {
@@ -254,6 +260,7 @@ SECURITY_MONITOR_CONFIG = {
     "batch_interval_min": 90,
     "batch_interval_max": 180,
     "max_audit_queue_size": 500,
+    "max_scan_chars": 8192,  # per-end window for content red-flag scans
     "escalation_threshold": 0.7,
     "critical_threshold": 0.9,
 }
@@ -265,13 +272,14 @@ SECURITY_HEARTBEAT_CONFIG = {
     "scan_processes": True,
     "scan_network": True,
     "scan_file_integrity": True,
-    "watched_paths": [
+    # Expanded once here rather than on every heartbeat scan
+    "watched_paths": tuple(_Path(p).expanduser() for p in (
         "/usr/local/bin",
         "~/Library/LaunchAgents",
         "~/Library/LaunchDaemons",
         "/Library/LaunchAgents",
         "/Library/LaunchDaemons",
-    ],
+    )),
     "baseline_path": str(STATE_DIR / "system_baseline.json"),
     "alert_on_new_process": True,
     "alert_on_new_connection": True,
@@ -287,24 +295,31 @@ HERMES_IDLE_TTL = 300
 PLANNER_MODEL = "hermes"
 
 # ── Channel Definitions ──
-# Dynamic based on enabled agents
-_base_channels = {
-    "#general": {"hermes", "coder", "math", "classifier", "reasoner"},
-    "#security": {"hermes", "security"},
-    "#code": {"hermes", "coder", "claude"},
-    "#ops": {"hermes", "classifier"},
-    "#analysis": {"hermes", "reasoner", "math"},
+_BASE_CHANNELS = {
+    "#general": frozenset({"hermes", "coder", "math", "classifier", "reasoner"}),
+    "#security": frozenset({"hermes", "security"}),
+    "#code": frozenset({"hermes", "coder", "claude"}),
+    "#ops": frozenset({"hermes", "classifier"}),
+    "#analysis": frozenset({"hermes", "reasoner", "math"}),
+}
+_CRM_CHANNELS = {
+    "#outreach": frozenset({"outreach", "reasoner", "coder"}),
+    "#content": frozenset({"content", "outreach", "reasoner"}),
 }
-if _profile.plugins.crm.enabled:
-    _base_channels["#outreach"] = {"outreach", "reasoner", "coder"}
-    _base_channels["#content"] = {"content", "outreach", "reasoner"}
-# Filter to only include enabled agents
-CHANNEL_DEFINITIONS = {}
-enabled_set = set(AGENT_DEFINITIONS.keys())
-for ch_name, ch_agents in _base_channels.items():
-    filtered = ch_agents & enabled_set
-    if filtered:
-        CHANNEL_DEFINITIONS[ch_name] = filtered
+
+
+@_cache
+def get_channel_definitions() -> dict:
+    """Channel membership, filtered to enabled agents."""
+    base_channels = _BASE_CHANNELS | _CRM_CHANNELS if _profile.plugins.crm.enabled else _BASE_CHANNELS
+    # Filter to only include enabled agents
+    enabled_set = frozenset(get_agent_definitions())
+    definitions = {}
+    for ch_name, ch_agents in base_channels.items():
+        filtered = ch_agents & enabled_set
+        if filtered:
+            definitions[ch_name] = filtered
+    return definitions
 
 # ── Cognitive Loop ──
 COGNITIVE_LOOP_CONFIG = {
@@ -320,3 +335,20 @@ COGNITIVE_LOOP_CONFIG = {
     "auto_draft_outreach": _profile.plugins.crm.enabled,
     "watched_directories": [],
 }
+
+
+# ── Lazily built definitions (PEP 562) ──
+# Profile-filtered catalogs are built on first access by their cached getter.
+# The module attributes are not pinned in globals(), so a getter's
+# cache_clear() (e.g. in tests) takes effect on the next attribute access.
+_LAZY_GETTERS = {
+    "AGENT_DEFINITIONS": get_agent_definitions,
+    "CHANNEL_DEFINITIONS": get_channel_definitions,
+}
+
+
+def __getattr__(name: str):
+    getter = _LAZY_GETTERS.get(name)
+    if getter is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getter()
@@ -10,6 +10,7 @@ Structure:
     classification.py  — Query classification and trivial response handling
     escalation.py      — Escalation flow and presentation layer
     chat_pipeline.py   — Main chat() pipeline
+    streaming.py       — Coalescing of streamed chunks into WebSocket frames
 
 Usage:
     from core import AgentCore
@@ -17,15 +18,27 @@ Usage:
     from core import _build_tool_schemas
 """
 
-# Re-export from agent_core for backward compatibility
-from core.agent_core import (
-    AgentCore,
-    BackgroundTask,
-    _build_tool_schemas,
-)
+import importlib
 
 __all__ = [
     "AgentCore",
     "BackgroundTask",
     "_build_tool_schemas",
 ]
+
+# Re-exports are resolved lazily (PEP 562): importing a light submodule such
+# as core.background_tasks no longer drags in agent_core and everything it
+# imports. The first access binds the name in the package namespace.
+_LAZY_EXPORTS = {
+    "AgentCore": "core.agent_core",
+    "BackgroundTask": "core.background_tasks",
+    "_build_tool_schemas": "core.agent_core",
+}
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = globals()[name] = getattr(importlib.import_module(module_name), name)
+    return value
@@ -36,6 +36,13 @@ import httpx
 
 logger = logging.getLogger(__name__)
 
+# Optional: orjson serializes broadcast payloads ~2-5x faster than stdlib json
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 from config import (
     API_BASE,
     MODELS, MODEL_LABELS,
@@ -50,7 +57,7 @@ from config import (
 )
 from profile import get_profile
 from inference import InferenceRouter, get_router
-from memory import VectorMemory
+from memory import BatchedEmbedder, VectorMemory
 from memory_v2 import MemoryV2
 from tools import get_all_tools, get_execution_tools, get_tools_for_agent, set_core_ref
 
@@ -76,43 +83,72 @@ from core.classification import _ClassificationMixin
 from core.escalation import _EscalationMixin
 from core.chat_pipeline import _ChatPipelineMixin
 from core.background_tasks import BackgroundTask
+from core.streaming import StreamCoalescer
+
+
+def _dumps_ws(data: dict) -> str:
+    """Serialize a WebSocket payload the way Starlette's send_json does (compact, UTF-8)."""
+    if HAS_ORJSON:
+        try:
+            return orjson.dumps(data).decode()
+        except TypeError:
+            pass  # e.g. non-str keys — let stdlib json handle or reject it
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+
+
+# Tool schemas are built once per function and stored on the function itself
+# (fn._tool_schema), so every tool list (all, execution, per-agent) shares one
+# build and the schema lives exactly as long as the tool. Callables that reject
+# attributes (bound methods, builtins) fall back to this dict.
+# Schemas are treated as read-only by all consumers.
+_SCHEMA_CACHE: dict = {}
+
+
+def _tool_schema(fn) -> dict:
+    """OpenAI-compatible schema for one tool function (cached)."""
+    schema = getattr(fn, "_tool_schema", None) or _SCHEMA_CACHE.get(fn)
+    if schema is not None:
+        return schema
+
+    params = {}
+    required = []
+    sig_params = inspect.signature(fn).parameters
+    for name, hint in fn.__annotations__.items():
+        if name == "return":
+            continue
+        ptype = "string"
+        if hint == int:
+            ptype = "integer"
+        elif hint == float:
+            ptype = "number"
+        elif hint == bool:
+            ptype = "boolean"
+        params[name] = {"type": ptype, "description": f"The {name} parameter"}
+        if sig_params[name].default is inspect.Parameter.empty:
+            required.append(name)
+
+    schema = {
+        "type": "function",
+        "function": {
+            "name": fn.__name__,
+            "description": (fn.__doc__ or "").strip(),
+            "parameters": {
+                "type": "object",
+                "properties": params,
+                "required": required,
+            },
+        },
+    }
+    try:
+        fn._tool_schema = schema
+    except AttributeError:
+        _SCHEMA_CACHE[fn] = schema
+    return schema
 
 
 def _build_tool_schemas(tools: list) -> list[dict]:
     """Convert tool functions to OpenAI-compatible tool schemas."""
-    schemas = []
-    for fn in tools:
-        hints = fn.__annotations__
-        params = {}
-        required = []
-        for name, hint in hints.items():
-            if name == "return":
-                continue
-            ptype = "string"
-            if hint == int:
-                ptype = "integer"
-            elif hint == float:
-                ptype = "number"
-            elif hint == bool:
-                ptype = "boolean"
-            params[name] = {"type": ptype, "description": f"The {name} parameter"}
-            sig = inspect.signature(fn)
-            if sig.parameters[name].default is inspect.Parameter.empty:
-                required.append(name)
-
-        schemas.append({
-            "type": "function",
-            "function": {
-                "name": fn.__name__,
-                "description": (fn.__doc__ or "").strip(),
-                "parameters": {
-                    "type": "object",
-                    "properties": params,
-                    "required": required,
-                },
-            },
-        })
-    return schemas
+    return [_tool_schema(fn) for fn in tools]
 
 
 class AgentCore(_StateMixin, _ClassificationMixin, _EscalationMixin, _ChatPipelineMixin):
@@ -123,6 +159,13 @@ class AgentCore(_StateMixin, _ClassificationMixin, _EscalationMixin, _ChatPipeli
         self.tools = get_all_tools()
         self.tool_schemas = _build_tool_schemas(self.tools)
         self.tool_map = {fn.__name__: fn for fn in self.tools}
+        # Dispatch tables split once so _execute_tool needn't inspect results
+        self._async_tool_map = {
+            name: fn for name, fn in self.tool_map.items() if inspect.iscoroutinefunction(fn)
+        }
+        self._sync_tool_map = {
+            name: fn for name, fn in self.tool_map.items() if name not in self._async_tool_map
+        }
         self.exec_tools = get_execution_tools()
         self.exec_tool_schemas = _build_tool_schemas(self.exec_tools)
         self.exec_tool_map = {fn.__name__: fn for fn in self.exec_tools}
@@ -144,10 +187,18 @@ class AgentCore(_StateMixin, _ClassificationMixin, _EscalationMixin, _ChatPipeli
         self.channel_manager: Optional[ChannelManager] = None
         # Escalation state — pending user decisions
         self._pending_escalations: dict[str, dict] = {}
+        # TRIVIAL replies use the conversational model (always loaded, 8B) —
+        # fast + personality. Falls back to primary if it isn't configured.
+        self._trivial_model_key = "conversational" if MODELS.get("conversational") else "primary"
+        self._trivial_model_id = MODELS.get(self._trivial_model_key)
+        self._trivial_model_label = MODEL_LABELS.get(
+            self._trivial_model_key, self._trivial_model_key.title()
+        )
         # Cognitive loop
         self.cognitive_loop = None
         # Persistent state
         self._state = self._load_state()
+        self._last_soul_hash: Optional[int] = None
         self._startup_time: Optional[float] = None
         # Model lifecycle manager
         self.model_manager: Optional[ModelManager] = None
@@ -218,16 +269,27 @@ class AgentCore(_StateMixin, _ClassificationMixin, _EscalationMixin, _ChatPipeli
             logger.error("Cannot reach inference backend at %s: %s", API_BASE, e)
             return
 
-        for key, model_id in MODELS.items():
-            if model_id in backend_models:
-                state = self.inference.get_model_state(model_id)
-                self.available_models[key] = True
-                self.model_states[key] = state
-                logger.info("+ %s -> %s (%s)", key, model_id, state)
-            else:
-                self.available_models[key] = False
-                self.model_states[key] = "missing"
-                logger.warning("x %s -> %s (not available)", key, model_id)
+        self.available_models.update(
+            {key: model_id in backend_models for key, model_id in MODELS.items()}
+        )
+        self.model_states.update({
+            key: self.inference.get_model_state(model_id) if model_id in backend_models else "missing"
+            for key, model_id in MODELS.items()
+        })
+        # One record per outcome rather than one per model
+        if logger.isEnabledFor(logging.INFO):
+            found = [
+                f"+ {key} -> {model_id} ({self.model_states[key]})"
+                for key, model_id in MODELS.items() if self.available_models[key]
+            ]
+            if found:
+                logger.info("Models discovered:\n  %s", "\n  ".join(found))
+        missing = [
+            f"x {key} -> {model_id} (not available)"
+            for key, model_id in MODELS.items() if not self.available_models[key]
+        ]
+        if missing:
+            logger.warning("Models missing:\n  %s", "\n  ".join(missing))
 
         logger.info("+ claude -> claude-code CLI (Max plan)")
 
@@ -238,14 +300,21 @@ class AgentCore(_StateMixin, _ClassificationMixin, _EscalationMixin, _ChatPipeli
         # Initialize agent system (creates ModelManager)
         self._init_agent_system()
 
-        # Initialize Memory V2
-        await self._init_memory_v2()
+        # Memory V2 init and the always-on model loads are independent I/O, so
+        # overlap them. Each handles its own errors; gather only guards against
+        # one failing start aborting the other.
+        results = await asyncio.gather(
+            self._init_memory_v2(),
+            self._start_model_manager(),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                logger.error("Startup step failed: %s", result)
 
-        # Start model lifecycle manager — loads always-on models
-        if self.model_manager:
-            await self.model_manager.start()
-            logger.info("ModelManager: always-loaded=%s, managed=%s",
-                        sorted(ALWAYS_LOADED_MODELS), sorted(MANAGED_MODELS))
+        # ModelManager was built before Memory V2 existed; hand it the monitor now
+        if self.model_manager and self.memory_v2 and hasattr(self.memory_v2, "_system"):
+            self.model_manager.set_system_awareness(self.memory_v2._system)
 
         self._ready = True
 
@@ -277,6 +346,13 @@ class AgentCore(_StateMixin, _ClassificationMixin, _EscalationMixin, _ChatPipeli
 
         logger.info("Core ready")
 
+    async def _start_model_manager(self):
+        """Start model lifecycle manager — loads always-on models."""
+        if self.model_manager:
+            await self.model_manager.start()
+            logger.info("ModelManager: always-loaded=%s, managed=%s",
+                        sorted(ALWAYS_LOADED_MODELS), sorted(MANAGED_MODELS))
+
     def _init_agent_system(self):
         """Initialize the multi-agent architecture via auto-registration."""
         try:
@@ -371,11 +447,16 @@ class AgentCore(_StateMixin, _ClassificationMixin, _EscalationMixin, _ChatPipeli
     async def _init_memory_v2(self):
         """Initialize Memory V2 — self-aware, self-populating memory system."""
         try:
-            # Create embedder wrapper using existing infrastructure
-            async def embedder(text: str) -> list[float]:
-                if not self.memory._api_base or not self.memory._embed_model:
-                    raise RuntimeError("Embedder not configured")
-                return await self.memory.embed(text)
+            # Embedder wrapper using existing infrastructure. start() configures
+            # V1's embedder whenever the model is available, so that is checked
+            # once here instead of on every embed. Concurrent memory writes
+            # share batched /v1/embeddings requests.
+            embedder = None
+            if self.available_models.get("embedder"):
+                if self.memory._api_base and self.memory._embed_model:
+                    embedder = BatchedEmbedder(self.memory.embed_batch).embed
+                else:
+                    logger.warning("Memory V2: embedder available but not configured")
 
             # Create LLM client wrapper for extraction/summarization
             async def llm_client(model: str, messages: list, **kwargs) -> str:
@@ -387,7 +468,7 @@ class AgentCore(_StateMixin, _ClassificationMixin, _EscalationMixin, _ChatPipeli
 
             # Initialize Memory V2
             self.memory_v2 = MemoryV2(
-                embedder=embedder if self.available_models.get("embedder") else None,
+                embedder=embedder,
                 llm_client=llm_client,
                 inference_url=API_BASE
             )
@@ -470,7 +551,10 @@ class AgentCore(_StateMixin, _ClassificationMixin, _EscalationMixin, _ChatPipeli
         if self.memory_v2:
             await self.memory_v2.stop()
         # Save persistent state
-        self._save_state()
+        await self._save_state()
+        # Close pooled HTTP connections
+        await self.inference.close()
+        await self.memory.close()
 
     # ── LLM Calls ──
 
@@ -490,25 +574,26 @@ class AgentCore(_StateMixin, _ClassificationMixin, _EscalationMixin, _ChatPipeli
     async def _call_llm_stream(self, model_id: str, messages: list[dict],
                                max_tokens: int = 2048, temperature: float = 0.7) -> str:
         """Streaming LLM call — yields text chunks via WebSocket, returns full response."""
-        async def on_chunk(content: str):
-            await self.broadcast({"type": "stream_chunk", "content": content})
-
-        return await self.inference.call_llm_stream(
-            model_id, messages,
-            max_tokens=max_tokens, temperature=temperature,
-            on_chunk=on_chunk,
-        )
+        coalescer = StreamCoalescer(self.broadcast_text)
+        try:
+            return await self.inference.call_llm_stream(
+                model_id, messages,
+                max_tokens=max_tokens, temperature=temperature,
+                on_chunk=coalescer.push,
+            )
+        finally:
+            await coalescer.close()
 
     async def _execute_tool(self, name: str, arguments: dict) -> str:
         """Execute a tool function by name."""
-        fn = self.tool_map.get(name)
-        if not fn:
-            return f"Error: unknown tool '{name}'"
         try:
-            result = fn(**arguments)
-            if asyncio.iscoroutine(result):
-                result = await result
-            return str(result)
+            afn = self._async_tool_map.get(name)
+            if afn:
+                return str(await afn(**arguments))
+            fn = self._sync_tool_map.get(name)
+            if not fn:
+                return f"Error: unknown tool '{name}'"
+            return str(fn(**arguments))
         except Exception as e:
             return f"Error executing {name}: {e}"
 
@@ -745,17 +830,31 @@ class AgentCore(_StateMixin, _ClassificationMixin, _EscalationMixin, _ChatPipeli
     # ── Broadcasting ──
 
     async def broadcast(self, data: dict):
-        """Send data to all connected WebSocket clients."""
-        dead = []
-        for ws in self.ws_clients:
-            try:
-                await ws.send_json(data)
-            except Exception as e:
-                logger.warning("[Core] WebSocket broadcast failed, removing client: %s", e)
-                dead.append(ws)
-        for ws in dead:
-            if ws in self.ws_clients:
-                self.ws_clients.remove(ws)
+        """Send data to all connected WebSocket clients (serialized once)."""
+        if not self.ws_clients:
+            return
+        try:
+            text = _dumps_ws(data)
+        except (TypeError, ValueError) as e:
+            logger.warning("[Core] Unserializable broadcast dropped (%s): %s", data.get("type"), e)
+            return
+        await self.broadcast_text(text)
+
+    async def broadcast_text(self, text: str):
+        """Send an already-serialized JSON message to all connected WebSocket clients.
+
+        Sends run concurrently, so one slow client doesn't delay the rest.
+        """
+        # Snapshot: clients may connect or disconnect while sends are in flight
+        clients = tuple(self.ws_clients)
+        results = await asyncio.gather(
+            *(ws.send_text(text) for ws in clients), return_exceptions=True,
+        )
+        for ws, result in zip(clients, results):
+            if isinstance(result, Exception):
+                logger.warning("[Core] WebSocket broadcast failed, removing client: %s", result)
+                if ws in self.ws_clients:
+                    self.ws_clients.remove(ws)
 
     # ── Status ──
 
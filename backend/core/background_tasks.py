@@ -11,6 +11,12 @@ from typing import Optional
 class BackgroundTask:
     """Represents an autonomous long-running task."""
 
+    # Tasks accumulate in AgentCore._tasks for the process lifetime
+    __slots__ = (
+        "id", "description", "plan", "status", "progress_log", "result",
+        "created_at", "updated_at", "_task",
+    )
+
     def __init__(self, task_id: str, description: str, plan: list[dict]):
         self.id = task_id
         self.description = description
@@ -24,12 +30,13 @@ class BackgroundTask:
 
     def log(self, message: str, step: Optional[str] = None):
         """Log progress for this task."""
+        now = datetime.now(timezone.utc).isoformat()
         self.progress_log.append({
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": now,
             "step": step,
             "message": message,
         })
-        self.updated_at = datetime.now(timezone.utc).isoformat()
+        self.updated_at = now
 
     def to_dict(self) -> dict:
         """Convert task to serializable dictionary."""
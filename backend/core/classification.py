@@ -11,30 +11,70 @@ from datetime import datetime
 from typing import Optional
 
 from config import (
-    MODELS, MODEL_LABELS,
+    MODELS,
     CLASSIFIER_MAX_TOKENS, CLASSIFIER_TEMPERATURE,
     TRIVIAL_RESPONSE_MAX_TOKENS, TRIVIAL_RESPONSE_TEMPERATURE,
 )
+from core.streaming import StreamCoalescer
 from agents.prompts import (
-    SUSPICIOUS_PATTERNS, CLASSIFIER_PROMPT,
+    SUSPICIOUS_PATTERNS, SUSPICIOUS_UNION, build_classifier_prompt,
     build_trivial_prompt,
 )
 
 logger = logging.getLogger(__name__)
 
+# Rule-based tiers decided before the classifier model is consulted
+_TRIVIAL_RE = re.compile(
+    r"^\s*(hi|hello|hey|thanks|thank you|ok|yes|no|bye)[!.?]*\s*$", re.IGNORECASE,
+)
+_COMPLEX_TOKENS = re.compile(r"```|https?://|\bstep\s*1\b", re.IGNORECASE)
+_TRIVIAL_MAX_CHARS = 32
+_COMPLEX_MIN_CHARS = 2000
+
+
+# Prompt clock has minute resolution, so format it at most once a minute
+_TIME_CACHE = {"epoch_minute": -1, "text": ""}
+
+
+def _current_time_str() -> str:
+    """Local time for the trivial prompt, e.g. 'Monday, May 04, 2026 at 09:15 AM'."""
+    epoch_minute = int(time.time() // 60)
+    cache = _TIME_CACHE
+    if cache["epoch_minute"] != epoch_minute:
+        cache["text"] = datetime.now().strftime("%A, %B %d, %Y at %I:%M %p")
+        cache["epoch_minute"] = epoch_minute
+    return cache["text"]
+
+
+def _heuristic_tier(message: str) -> Optional[str]:
+    """Return a tier for messages cheap rules can settle, else None."""
+    n = len(message)
+    if n < _TRIVIAL_MAX_CHARS and _TRIVIAL_RE.match(message):
+        return "TRIVIAL"
+    if n > _COMPLEX_MIN_CHARS or len(_COMPLEX_TOKENS.findall(message)) > 2:
+        return "COMPLEX"
+    return None
+
 
 class _ClassificationMixin:
     """Mixin providing query classification, trivial handling, and passive security."""
 
     async def _classify_query(self, message: str) -> str:
-        """Use classifier agent (Qwen3-0.6B) to classify: TRIVIAL, SIMPLE, or COMPLEX."""
+        """Use classifier agent (Qwen3-0.6B) to classify: TRIVIAL, SIMPLE, or COMPLEX.
+
+        Greetings and long or code/link-heavy messages are settled by
+        _heuristic_tier without a model call.
+        """
+        tier = _heuristic_tier(message)
+        if tier:
+            return tier
         classifier = self.registry.get("classifier") if self.registry else None
         if not classifier:
             # Fallback if classifier agent not available
             if not self.available_models.get("classifier"):
                 return "COMPLEX"
             try:
-                prompt = CLASSIFIER_PROMPT.replace("{query}", message[:500])
+                prompt = build_classifier_prompt(message[:500])
                 result = await self._call_llm(
                     MODELS["classifier"],
                     [{"role": "user", "content": prompt}],
@@ -65,13 +105,19 @@ class _ClassificationMixin:
         No model spin-up required — conversational is always resident.
         """
         t0 = time.time()
-        current_time = datetime.now().strftime("%A, %B %d, %Y at %I:%M %p")
-
-        # Use conversational model (always loaded, 8B) — fast + personality.
-        # Falls back to primary if conversational isn't configured.
-        trivial_model = MODELS.get("conversational") or MODELS.get("primary")
-        model_key = "conversational" if MODELS.get("conversational") else "primary"
+        # Memory V2 retrieval runs while the prompt is assembled; joined
+        # before generation starts.
+        mem_task = asyncio.create_task(
+            self.memory_v2.build_context(message, session_id=self._current_session_id)
+        ) if self.memory_v2 else None
+        current_time = _current_time_str()
+
+        # Conversational model (resolved once in AgentCore.__init__)
+        trivial_model = self._trivial_model_id
+        model_key = self._trivial_model_key
         if not trivial_model:
+            if mem_task:
+                mem_task.cancel()
             return {
                 "content": "No model configured.",
                 "model": "none", "model_key": "none", "error": True,
@@ -80,11 +126,9 @@ class _ClassificationMixin:
         system_prompt = build_trivial_prompt(current_time)
 
         # Inject Memory V2 context if available
-        if self.memory_v2:
+        if mem_task:
             try:
-                memory_context = await self.memory_v2.build_context(
-                    message, session_id=self._current_session_id
-                )
+                memory_context = await mem_task
                 if memory_context.get("context"):
                     system_prompt = f"{system_prompt}\n\n## User Context\n{memory_context['context']}"
             except Exception:
@@ -93,23 +137,24 @@ class _ClassificationMixin:
         if self._soul_context:
             system_prompt = f"{system_prompt}\n\n## Persistent Context\n{self._soul_context}"
 
-        msgs = [{"role": "system", "content": system_prompt}]
-        if history:
-            msgs.extend(history[-4:])
-        msgs.append({"role": "user", "content": message})
+        msgs = [
+            {"role": "system", "content": system_prompt},
+            *(history[-4:] if history else ()),
+            {"role": "user", "content": message},
+        ]
 
+        coalescer = StreamCoalescer(self.broadcast_text)
         try:
-            async def on_chunk(content_chunk: str):
-                await self.broadcast({"type": "stream_chunk", "content": content_chunk})
-
             content = await self.inference.call_llm_stream(
                 trivial_model, msgs,
                 max_tokens=TRIVIAL_RESPONSE_MAX_TOKENS,
                 temperature=TRIVIAL_RESPONSE_TEMPERATURE,
-                on_chunk=on_chunk,
+                on_chunk=coalescer.push,
             )
         except Exception as e:
             content = f"Error: {e}"
+        finally:
+            await coalescer.close()
 
         elapsed = time.time() - t0
 
@@ -121,7 +166,7 @@ class _ClassificationMixin:
             "content": content,
             "model": model_key,
             "model_key": model_key,
-            "model_label": MODEL_LABELS.get(model_key, model_key.title()),
+            "model_label": self._trivial_model_label,
             "elapsed_seconds": round(elapsed, 2),
             "tool_calls": [],
             "plan": None,
@@ -132,8 +177,9 @@ class _ClassificationMixin:
     def _passive_security_check(self, text: str) -> Optional[str]:
         """Lightweight pattern-based screening for prompt injection and suspicious input.
         Returns a warning string if suspicious, None if clean."""
-        text_lower = text.lower()
-        for pattern in SUSPICIOUS_PATTERNS:
-            if re.search(pattern, text_lower):
-                return f"Passive security flag: matched pattern '{pattern}' in input"
-        return None
+        # One scan; the earliest match's wrapping group identifies its pattern
+        match = SUSPICIOUS_UNION.search(text)
+        if not match:
+            return None
+        pattern = SUSPICIOUS_PATTERNS[int(match.lastgroup[1:])]
+        return f"Passive security flag: matched pattern '{pattern.pattern}' in input"
@@ -10,6 +10,7 @@ from config import (
     MODELS, TOKEN_LIMITS, TEMPERATURE,
     CONTEXT_WINDOW_SIZE, ESCALATION_CONFIG,
 )
+from core.streaming import StreamCoalescer
 from agents.prompts import get_presentation_prompt
 
 logger = logging.getLogger(__name__)
@@ -105,16 +106,16 @@ Present these findings to the user. Be direct, thorough, and actionable."""
                 msgs.append({"role": h["role"], "content": h["content"]})
         msgs.append({"role": "user", "content": prompt})
 
+        coalescer = StreamCoalescer(self.broadcast_text)
         try:
-            async def on_chunk(content_chunk: str):
-                await self.broadcast({"type": "stream_chunk", "content": content_chunk})
-
             return await self.inference.call_llm_stream(
                 primary_model, msgs,
                 max_tokens=TOKEN_LIMITS.get("primary", 4096),
                 temperature=TEMPERATURE.get("primary", 0.7),
-                on_chunk=on_chunk,
+                on_chunk=coalescer.push,
             )
         except Exception as e:
             logger.warning("Presentation layer failed: %s — returning raw content", e)
             return raw_content
+        finally:
+            await coalescer.close()
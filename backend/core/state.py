@@ -3,16 +3,73 @@ State persistence — load/save state.json and SOUL.md context.
 Extracted from agent_core.py for modularity.
 """
 
+import asyncio
+import heapq
 import json
 import logging
+import os
 import time
 from datetime import datetime, timezone
+from pathlib import Path
 
 from config import STATE_DIR, STATE_FILE_PATH, SOUL_FILE_PATH
 from profile import get_profile
 
+# Optional: orjson (de)serializes state ~3-5x faster than stdlib json
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 logger = logging.getLogger(__name__)
 
+# SOUL.md layout; sections are pre-joined before formatting
+_SOUL_TEMPLATE = """# {system_name} Soul — Last Updated {now}
+
+## Current Focus
+Monitoring system security and managing tasks. Total uptime: {uptime_hrs} hours.
+
+## Recent Context
+{tasks}
+
+## Security Heartbeat
+- Scans completed: {scan_count}
+- Last scan: {last_scan}
+- Anomalies found: {anomalies_found}
+
+## Active Watches
+{monitors}
+
+## Cognitive Loop
+- Cycles: {cycle_count}
+- Last briefing: {last_briefing_type} on {last_briefing_date}
+"""
+
+
+def _loads_state(data: bytes) -> dict:
+    """Parse state.json bytes (no separate decode pass)."""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps_state(state: dict) -> bytes:
+    """Serialize the state dict to compact JSON bytes."""
+    if HAS_ORJSON:
+        try:
+            return orjson.dumps(state)
+        except TypeError:
+            pass  # e.g. non-str keys or >64-bit ints — stdlib json accepts them
+    return json.dumps(state, separators=(",", ":")).encode()
+
+
+def _atomic_write(path: Path, data: bytes):
+    """Write data to path via a temp file and rename, so readers never see a partial file."""
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
 
 class _StateMixin:
     """Mixin providing persistent state and SOUL.md management for AgentCore."""
@@ -21,7 +78,7 @@ class _StateMixin:
         """Load persistent state from state.json."""
         try:
             if STATE_FILE_PATH.exists():
-                return json.loads(STATE_FILE_PATH.read_text())
+                return _loads_state(STATE_FILE_PATH.read_bytes())
         except Exception as e:
             logger.warning("[Core] Failed to load state: %s", e)
         return {
@@ -42,8 +99,11 @@ class _StateMixin:
             },
         }
 
-    def _save_state(self):
-        """Write persistent state to state.json and SOUL.md."""
+    async def _save_state(self):
+        """Write persistent state to state.json and SOUL.md.
+
+        Serialization happens on the loop; the disk writes run in a thread.
+        """
         try:
             STATE_DIR.mkdir(parents=True, exist_ok=True)
 
@@ -54,11 +114,9 @@ class _StateMixin:
             self._state["last_shutdown"] = datetime.now(timezone.utc).isoformat()
 
             # Capture last 5 tasks
-            recent_tasks = sorted(
-                self._tasks.values(),
-                key=lambda t: t.updated_at,
-                reverse=True,
-            )[:5]
+            recent_tasks = heapq.nlargest(
+                5, self._tasks.values(), key=lambda t: t.updated_at,
+            )
             self._state["last_5_tasks"] = [
                 {
                     "id": t.id,
@@ -82,54 +140,52 @@ class _StateMixin:
                 status = self.cognitive_loop.get_status()
                 self._state["cognitive_loop"]["cycle_count"] = status.get("cycle_count", 0)
 
-            STATE_FILE_PATH.write_text(json.dumps(self._state, indent=2))
+            data = _dumps_state(self._state)
+            await asyncio.to_thread(_atomic_write, STATE_FILE_PATH, data)
 
             # Write SOUL.md
-            self._write_soul()
+            await self._write_soul()
 
             logger.info("[Core] State saved")
         except Exception as e:
             logger.warning("[Core] Failed to save state: %s", e)
 
-    def _write_soul(self):
-        """Write SOUL.md — LLM-readable narrative context for continuity."""
+    async def _write_soul(self):
+        """Write SOUL.md — LLM-readable narrative context for continuity.
+
+        Skipped when the rendered text is unchanged since the last write.
+        """
         profile = get_profile()
         system_name = profile.system.name or "Assistant"
         now = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M")
         state = self._state
 
-        # Build recent context
-        task_lines = []
-        for t in state.get("last_5_tasks", []):
-            task_lines.append(f"- [{t['status']}] {t['description']}")
-
         hb = state.get("security_heartbeat", {})
         monitors = state.get("active_monitors", [])
         cog = state.get("cognitive_loop", {})
-        uptime_hrs = round(state.get("uptime_seconds", 0) / 3600, 1)
-
-        soul = f"""# {system_name} Soul — Last Updated {now}
-
-## Current Focus
-Monitoring system security and managing tasks. Total uptime: {uptime_hrs} hours.
-
-## Recent Context
-{chr(10).join(task_lines) if task_lines else "- No recent tasks."}
-
-## Security Heartbeat
-- Scans completed: {hb.get('scan_count', 0)}
-- Last scan: {hb.get('last_scan', 'never')}
-- Anomalies found: {hb.get('anomalies_found', 0)}
 
-## Active Watches
-{chr(10).join(f'- {m}' for m in monitors) if monitors else '- None active.'}
-
-## Cognitive Loop
-- Cycles: {cog.get('cycle_count', 0)}
-- Last briefing: {cog.get('last_briefing_type', 'none')} on {cog.get('last_briefing_date', 'N/A')}
-"""
+        soul = _SOUL_TEMPLATE.format(
+            system_name=system_name,
+            now=now,
+            uptime_hrs=round(state.get("uptime_seconds", 0) / 3600, 1),
+            tasks="\n".join(
+                f"- [{t['status']}] {t['description']}"
+                for t in state.get("last_5_tasks", [])
+            ) or "- No recent tasks.",
+            scan_count=hb.get('scan_count', 0),
+            last_scan=hb.get('last_scan', 'never'),
+            anomalies_found=hb.get('anomalies_found', 0),
+            monitors="\n".join(f"- {m}" for m in monitors) or "- None active.",
+            cycle_count=cog.get('cycle_count', 0),
+            last_briefing_type=cog.get('last_briefing_type', 'none'),
+            last_briefing_date=cog.get('last_briefing_date', 'N/A'),
+        )
+        soul_hash = hash(soul)
+        if soul_hash == self._last_soul_hash:
+            return
         try:
-            SOUL_FILE_PATH.write_text(soul)
+            await asyncio.to_thread(_atomic_write, SOUL_FILE_PATH, soul.encode())
+            self._last_soul_hash = soul_hash
         except Exception as e:
             logger.warning("[%s] Failed to write SOUL.md: %s", system_name, e)
 
@@ -0,0 +1,73 @@
+"""
+Stream chunk coalescing — batches streamed LLM tokens into fewer WebSocket frames.
+"""
+
+import asyncio
+import json
+from typing import Awaitable, Callable, Optional
+
+# Optional: orjson encodes the chunk string faster than stdlib json
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Frame prefix; only the content string is encoded per flush
+_STREAM_HEADER = '{"type":"stream_chunk","content":'
+
+
+def _encode_content(content: str) -> str:
+    if HAS_ORJSON:
+        return orjson.dumps(content).decode()
+    return json.dumps(content, ensure_ascii=False)
+
+
+class StreamCoalescer:
+    """Buffers streamed content and broadcasts it as coalesced stream_chunk frames.
+
+    Chunks are held for up to `window` seconds (or until `max_chunks` arrive)
+    and sent as one frame. Use push() as the on_chunk callback and always
+    await close() when the stream ends so the tail is delivered.
+    """
+
+    def __init__(self, send_text: Callable[[str], Awaitable[None]],
+                 window: float = 0.016, max_chunks: int = 32):
+        self._send_text = send_text
+        self._window = window
+        self._max_chunks = max_chunks
+        self._buf: list[str] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._timer_flush: Optional[asyncio.Task] = None
+        # Flushes run in FIFO order so frames never overtake each other
+        self._lock = asyncio.Lock()
+
+    async def push(self, content: str):
+        """Buffer a chunk; flush immediately once the buffer is full."""
+        self._buf.append(content)
+        if len(self._buf) >= self._max_chunks:
+            await self.flush()
+        elif self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(self._window, self._on_timer)
+
+    def _on_timer(self):
+        self._timer = None
+        self._timer_flush = asyncio.ensure_future(self.flush())
+
+    async def flush(self):
+        """Send everything buffered so far as a single frame."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._buf:
+            return
+        text = _STREAM_HEADER + _encode_content("".join(self._buf)) + "}"
+        self._buf.clear()
+        async with self._lock:
+            await self._send_text(text)
+
+    async def close(self):
+        """Flush the remaining tail and wait for any timer-driven flush."""
+        await self.flush()
+        if self._timer_flush is not None:
+            await self._timer_flush
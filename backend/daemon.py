@@ -17,6 +17,14 @@ import sys
 import time
 from pathlib import Path
 
+# Optional: uvloop's faster event loop (pip install uvloop). main.py's
+# uvicorn.run() already selects it automatically via loop="auto".
+try:
+    import uvloop
+    HAS_UVLOOP = True
+except ImportError:
+    HAS_UVLOOP = False
+
 # Ensure backend directory is on the path
 BACKEND_DIR = Path(__file__).parent
 sys.path.insert(0, str(BACKEND_DIR))
@@ -146,7 +154,10 @@ def run():
         await server_task
 
     try:
-        asyncio.run(serve())
+        if HAS_UVLOOP:
+            uvloop.run(serve())
+        else:
+            asyncio.run(serve())
     except KeyboardInterrupt:
         pass
     finally:
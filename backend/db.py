@@ -2,7 +2,9 @@
 Shared database utilities — consistent SQLite connection management.
 
 All connections use WAL mode for concurrent read access and a 5-second
-busy timeout to prevent SQLITE_BUSY errors under async load.
+busy timeout to prevent SQLITE_BUSY errors under async load. Per-connection
+tuning (NORMAL sync, in-memory temp tables, a larger page cache) keeps
+repeated COUNT/GROUP BY reads in memory.
 """
 
 import logging
@@ -18,15 +20,27 @@ DB_PATH = Path(__file__).parent / "gps.db"
 # We set it on first connection and cache the flag to avoid redundant PRAGMAs.
 _wal_initialized = False
 
+# Per-connection settings (not persisted in the database file), applied on every connect.
+# synchronous=NORMAL is durable under WAL except for the last commits on power loss.
+_CONNECTION_PRAGMAS = (
+    "PRAGMA busy_timeout = 5000;"
+    "PRAGMA foreign_keys = ON;"
+    "PRAGMA synchronous = NORMAL;"
+    "PRAGMA temp_store = MEMORY;"
+    "PRAGMA cache_size = -65536;"  # 64 MB, allocated only as pages are read
+)
 
-def _configure_connection(conn: sqlite3.Connection):
-    """Apply standard connection settings: WAL mode, busy timeout, foreign keys."""
+
+def _configure_connection(conn: sqlite3.Connection, query_only: bool = False):
+    """Apply standard connection settings: WAL mode, busy timeout, foreign keys,
+    sync level and cache sizing. query_only rejects writes on this connection."""
     global _wal_initialized
-    conn.execute("PRAGMA busy_timeout = 5000")
-    conn.execute("PRAGMA foreign_keys = ON")
+    conn.executescript(_CONNECTION_PRAGMAS)
     if not _wal_initialized:
         conn.execute("PRAGMA journal_mode = WAL")
         _wal_initialized = True
+    if query_only:
+        conn.execute("PRAGMA query_only = ON")
 
 
 @contextmanager
@@ -42,12 +56,15 @@ def db_connection():
 
 
 @contextmanager
-def db_connection_row():
+def db_connection_row(query_only: bool = False, check_same_thread: bool = True):
     """Context manager that returns a connection with Row factory enabled.
-    Configures WAL mode and busy timeout automatically."""
-    conn = sqlite3.connect(str(DB_PATH))
+    Configures WAL mode and busy timeout automatically.
+    Pass query_only=True for read paths that must never write, and
+    check_same_thread=False when the caller hands the connection to worker
+    threads (e.g. asyncio.to_thread) and serializes its use."""
+    conn = sqlite3.connect(str(DB_PATH), check_same_thread=check_same_thread)
     conn.row_factory = sqlite3.Row
-    _configure_connection(conn)
+    _configure_connection(conn, query_only=query_only)
     try:
         yield conn
     finally:
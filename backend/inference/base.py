@@ -10,8 +10,14 @@ import logging
 from abc import ABC, abstractmethod
 from typing import AsyncGenerator, Optional
 
+import httpx
+
 logger = logging.getLogger(__name__)
 
+# Connection pool for the shared per-backend client. Inference and embedding
+# calls reuse keep-alive connections instead of reconnecting per request.
+_HTTP_LIMITS = httpx.Limits(max_connections=128, max_keepalive_connections=64)
+
 
 class InferenceBackend(ABC):
     """Abstract inference backend interface.
@@ -30,6 +36,25 @@ class InferenceBackend(ABC):
         self._max_slots = 4
         self._model_capabilities: dict[str, list[str]] = {}
         self._slot_lock = asyncio.Lock()
+        self._client: Optional[httpx.AsyncClient] = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the backend's shared HTTP client, creating it on first use.
+
+        Callers pass their own per-request timeout; the client default is
+        only a fallback.
+        """
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=self.default_timeout, limits=_HTTP_LIMITS,
+            )
+        return self._client
+
+    async def close(self):
+        """Close the shared HTTP client."""
+        if self._client:
+            await self._client.aclose()
+            self._client = None
 
     # ── Model Discovery ──
 
@@ -253,15 +253,14 @@ class LlamaCppBackend(InferenceBackend):
             if tool_choice:
                 payload["tool_choice"] = tool_choice
 
-        async with httpx.AsyncClient(
-            timeout=timeout or self.default_timeout
-        ) as client:
-            resp = await client.post(
-                f"{self.base_url}/v1/chat/completions",
-                json=payload,
-            )
-            resp.raise_for_status()
-            return resp.json()
+        client = self._get_client()
+        resp = await client.post(
+            f"{self.base_url}/v1/chat/completions",
+            json=payload,
+            timeout=timeout or self.default_timeout,
+        )
+        resp.raise_for_status()
+        return resp.json()
 
     async def _call_llm_legacy(
         self,
@@ -282,15 +281,14 @@ class LlamaCppBackend(InferenceBackend):
             "stream": False,
         }
 
-        async with httpx.AsyncClient(
-            timeout=timeout or self.default_timeout
-        ) as client:
-            resp = await client.post(
-                f"{self.base_url}/completion",
-                json=payload,
-            )
-            resp.raise_for_status()
-            data = resp.json()
+        client = self._get_client()
+        resp = await client.post(
+            f"{self.base_url}/completion",
+            json=payload,
+            timeout=timeout or self.default_timeout,
+        )
+        resp.raise_for_status()
+        data = resp.json()
 
         return _legacy_response_to_openai(data, model_id)
 
@@ -334,27 +332,28 @@ class LlamaCppBackend(InferenceBackend):
             "stream": True,
         }
         full_text = ""
-        async with httpx.AsyncClient(timeout=self.default_timeout) as client:
-            async with client.stream(
-                "POST", f"{self.base_url}/v1/chat/completions", json=payload
-            ) as resp:
-                resp.raise_for_status()
-                async for line in resp.aiter_lines():
-                    if not line.startswith("data: "):
-                        continue
-                    data = line[6:]
-                    if data.strip() == "[DONE]":
-                        break
-                    try:
-                        chunk = json.loads(data)
-                        delta = chunk.get("choices", [{}])[0].get("delta", {})
-                        content = delta.get("content", "")
-                        if content:
-                            full_text += content
-                            if on_chunk:
-                                await on_chunk(content)
-                    except json.JSONDecodeError:
-                        continue
+        client = self._get_client()
+        async with client.stream(
+            "POST", f"{self.base_url}/v1/chat/completions", json=payload,
+            timeout=self.default_timeout,
+        ) as resp:
+            resp.raise_for_status()
+            async for line in resp.aiter_lines():
+                if not line.startswith("data: "):
+                    continue
+                data = line[6:]
+                if data.strip() == "[DONE]":
+                    break
+                try:
+                    chunk = json.loads(data)
+                    delta = chunk.get("choices", [{}])[0].get("delta", {})
+                    content = delta.get("content", "")
+                    if content:
+                        full_text += content
+                        if on_chunk:
+                            await on_chunk(content)
+                except json.JSONDecodeError:
+                    continue
         return full_text
 
     async def _stream_legacy(
@@ -380,33 +379,34 @@ class LlamaCppBackend(InferenceBackend):
         }
 
         full_text = ""
-        async with httpx.AsyncClient(timeout=self.default_timeout) as client:
-            async with client.stream(
-                "POST", f"{self.base_url}/completion", json=payload
-            ) as resp:
-                resp.raise_for_status()
-                async for line in resp.aiter_lines():
-                    if not line.strip():
-                        continue
-                    # Legacy format: "data: {json}"
-                    raw = line
-                    if raw.startswith("data: "):
-                        raw = raw[6:]
-                    try:
-                        chunk = json.loads(raw)
-                        content = chunk.get("content", "")
+        client = self._get_client()
+        async with client.stream(
+            "POST", f"{self.base_url}/completion", json=payload,
+            timeout=self.default_timeout,
+        ) as resp:
+            resp.raise_for_status()
+            async for line in resp.aiter_lines():
+                if not line.strip():
+                    continue
+                # Legacy format: "data: {json}"
+                raw = line
+                if raw.startswith("data: "):
+                    raw = raw[6:]
+                try:
+                    chunk = json.loads(raw)
+                    content = chunk.get("content", "")
+                    if content:
+                        # Strip ChatML tokens from streamed output
+                        if "<|im_end|>" in content:
+                            content = content.split("<|im_end|>")[0]
                         if content:
-                            # Strip ChatML tokens from streamed output
-                            if "<|im_end|>" in content:
-                                content = content.split("<|im_end|>")[0]
-                            if content:
-                                full_text += content
-                                if on_chunk:
-                                    await on_chunk(content)
-                        if chunk.get("stop", False):
-                            break
-                    except json.JSONDecodeError:
-                        continue
+                            full_text += content
+                            if on_chunk:
+                                await on_chunk(content)
+                    if chunk.get("stop", False):
+                        break
+                except json.JSONDecodeError:
+                    continue
         return full_text
 
     # ── Model Lifecycle ──
@@ -487,15 +487,14 @@ class LlamaCppBackend(InferenceBackend):
                 "model": model_id,
                 "input": texts,
             }
-            async with httpx.AsyncClient(
-                timeout=timeout or self.default_timeout
-            ) as client:
-                resp = await client.post(
-                    f"{self.base_url}/v1/embeddings",
-                    json=payload,
-                )
-                resp.raise_for_status()
-                data = resp.json()
+            client = self._get_client()
+            resp = await client.post(
+                f"{self.base_url}/v1/embeddings",
+                json=payload,
+                timeout=timeout or self.default_timeout,
+            )
+            resp.raise_for_status()
+            data = resp.json()
             embeddings_data = sorted(
                 data.get("data", []), key=lambda x: x.get("index", 0)
             )
@@ -503,16 +502,15 @@ class LlamaCppBackend(InferenceBackend):
         else:
             # Legacy: single-text /embedding endpoint
             embeddings = []
-            async with httpx.AsyncClient(
-                timeout=timeout or self.default_timeout
-            ) as client:
-                for text in texts:
-                    resp = await client.post(
-                        f"{self.base_url}/embedding",
-                        json={"content": text},
-                    )
-                    resp.raise_for_status()
-                    data = resp.json()
-                    embedding = data.get("embedding", [])
-                    embeddings.append(embedding)
+            client = self._get_client()
+            for text in texts:
+                resp = await client.post(
+                    f"{self.base_url}/embedding",
+                    json={"content": text},
+                    timeout=timeout or self.default_timeout,
+                )
+                resp.raise_for_status()
+                data = resp.json()
+                embedding = data.get("embedding", [])
+                embeddings.append(embedding)
             return embeddings
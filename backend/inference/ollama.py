@@ -171,15 +171,14 @@ class OllamaBackend(InferenceBackend):
         if tools:
             payload["tools"] = tools
 
-        async with httpx.AsyncClient(
-            timeout=timeout or self.default_timeout
-        ) as client:
-            resp = await client.post(
-                f"{self.base_url}/api/chat",
-                json=payload,
-            )
-            resp.raise_for_status()
-            ollama_resp = resp.json()
+        client = self._get_client()
+        resp = await client.post(
+            f"{self.base_url}/api/chat",
+            json=payload,
+            timeout=timeout or self.default_timeout,
+        )
+        resp.raise_for_status()
+        ollama_resp = resp.json()
 
         return _ollama_response_to_openai(ollama_resp, model_id)
 
@@ -209,25 +208,26 @@ class OllamaBackend(InferenceBackend):
         }
 
         full_text = ""
-        async with httpx.AsyncClient(timeout=self.default_timeout) as client:
-            async with client.stream(
-                "POST", f"{self.base_url}/api/chat", json=payload
-            ) as resp:
-                resp.raise_for_status()
-                async for line in resp.aiter_lines():
-                    if not line.strip():
-                        continue
-                    try:
-                        chunk = json.loads(line)
-                        content = chunk.get("message", {}).get("content", "")
-                        if content:
-                            full_text += content
-                            if on_chunk:
-                                await on_chunk(content)
-                        if chunk.get("done", False):
-                            break
-                    except json.JSONDecodeError:
-                        continue
+        client = self._get_client()
+        async with client.stream(
+            "POST", f"{self.base_url}/api/chat", json=payload,
+            timeout=self.default_timeout,
+        ) as resp:
+            resp.raise_for_status()
+            async for line in resp.aiter_lines():
+                if not line.strip():
+                    continue
+                try:
+                    chunk = json.loads(line)
+                    content = chunk.get("message", {}).get("content", "")
+                    if content:
+                        full_text += content
+                        if on_chunk:
+                            await on_chunk(content)
+                    if chunk.get("done", False):
+                        break
+                except json.JSONDecodeError:
+                    continue
         return full_text
 
     # ── Model Lifecycle ──
@@ -325,18 +325,17 @@ class OllamaBackend(InferenceBackend):
         """
         # Try batch endpoint first (Ollama v0.4+)
         try:
-            async with httpx.AsyncClient(
-                timeout=timeout or self.default_timeout
-            ) as client:
-                resp = await client.post(
-                    f"{self.base_url}/api/embed",
-                    json={"model": model_id, "input": texts},
-                )
-                resp.raise_for_status()
-                data = resp.json()
-                embeddings = data.get("embeddings", [])
-                if embeddings and len(embeddings) == len(texts):
-                    return embeddings
+            client = self._get_client()
+            resp = await client.post(
+                f"{self.base_url}/api/embed",
+                json={"model": model_id, "input": texts},
+                timeout=timeout or self.default_timeout,
+            )
+            resp.raise_for_status()
+            data = resp.json()
+            embeddings = data.get("embeddings", [])
+            if embeddings and len(embeddings) == len(texts):
+                return embeddings
         except httpx.HTTPStatusError:
             pass  # Endpoint not available, fall through
         except Exception:
@@ -344,18 +343,17 @@ class OllamaBackend(InferenceBackend):
 
         # Fallback: single-text endpoint
         embeddings = []
-        async with httpx.AsyncClient(
-            timeout=timeout or self.default_timeout
-        ) as client:
-            for text in texts:
-                resp = await client.post(
-                    f"{self.base_url}/api/embeddings",
-                    json={"model": model_id, "prompt": text},
-                )
-                resp.raise_for_status()
-                data = resp.json()
-                embedding = data.get("embedding", [])
-                embeddings.append(embedding)
+        client = self._get_client()
+        for text in texts:
+            resp = await client.post(
+                f"{self.base_url}/api/embeddings",
+                json={"model": model_id, "prompt": text},
+                timeout=timeout or self.default_timeout,
+            )
+            resp.raise_for_status()
+            data = resp.json()
+            embedding = data.get("embedding", [])
+            embeddings.append(embedding)
         return embeddings
 
     # ── Download ──
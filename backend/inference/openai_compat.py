@@ -102,15 +102,14 @@ class OpenAICompatBackend(InferenceBackend):
             if tool_choice:
                 payload["tool_choice"] = tool_choice
 
-        async with httpx.AsyncClient(
-            timeout=timeout or self.default_timeout
-        ) as client:
-            resp = await client.post(
-                f"{self.base_url}/v1/chat/completions",
-                json=payload,
-            )
-            resp.raise_for_status()
-            return resp.json()
+        client = self._get_client()
+        resp = await client.post(
+            f"{self.base_url}/v1/chat/completions",
+            json=payload,
+            timeout=timeout or self.default_timeout,
+        )
+        resp.raise_for_status()
+        return resp.json()
 
     async def call_llm_stream(
         self,
@@ -133,27 +132,28 @@ class OpenAICompatBackend(InferenceBackend):
             "stream": True,
         }
         full_text = ""
-        async with httpx.AsyncClient(timeout=self.default_timeout) as client:
-            async with client.stream(
-                "POST", f"{self.base_url}/v1/chat/completions", json=payload
-            ) as resp:
-                resp.raise_for_status()
-                async for line in resp.aiter_lines():
-                    if not line.startswith("data: "):
-                        continue
-                    data = line[6:]
-                    if data.strip() == "[DONE]":
-                        break
-                    try:
-                        chunk = json.loads(data)
-                        delta = chunk.get("choices", [{}])[0].get("delta", {})
-                        content = delta.get("content", "")
-                        if content:
-                            full_text += content
-                            if on_chunk:
-                                await on_chunk(content)
-                    except json.JSONDecodeError:
-                        continue
+        client = self._get_client()
+        async with client.stream(
+            "POST", f"{self.base_url}/v1/chat/completions", json=payload,
+            timeout=self.default_timeout,
+        ) as resp:
+            resp.raise_for_status()
+            async for line in resp.aiter_lines():
+                if not line.startswith("data: "):
+                    continue
+                data = line[6:]
+                if data.strip() == "[DONE]":
+                    break
+                try:
+                    chunk = json.loads(data)
+                    delta = chunk.get("choices", [{}])[0].get("delta", {})
+                    content = delta.get("content", "")
+                    if content:
+                        full_text += content
+                        if on_chunk:
+                            await on_chunk(content)
+                except json.JSONDecodeError:
+                    continue
         return full_text
 
     # ── Model Lifecycle ──
@@ -246,15 +246,14 @@ class OpenAICompatBackend(InferenceBackend):
             "model": model_id,
             "input": texts,
         }
-        async with httpx.AsyncClient(
-            timeout=timeout or self.default_timeout
-        ) as client:
-            resp = await client.post(
-                f"{self.base_url}/v1/embeddings",
-                json=payload,
-            )
-            resp.raise_for_status()
-            data = resp.json()
+        client = self._get_client()
+        resp = await client.post(
+            f"{self.base_url}/v1/embeddings",
+            json=payload,
+            timeout=timeout or self.default_timeout,
+        )
+        resp.raise_for_status()
+        data = resp.json()
 
         # Extract embedding vectors, sorted by index
         embeddings_data = sorted(data.get("data", []), key=lambda x: x.get("index", 0))
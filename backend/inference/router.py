@@ -342,6 +342,11 @@ class InferenceRouter:
         backend, model_id = self._resolve(model_key_or_id)
         return await backend.release_slot(model_id)
 
+    async def close(self):
+        """Close every backend's shared HTTP client."""
+        for backend in self._backends.values():
+            await backend.close()
+
 
 # ── Singleton ──
 
@@ -21,6 +21,57 @@ MEMORY_PATH = Path(__file__).parent / "memory.jsonl"
 MAX_MEMORY_ENTRIES = 10_000  # Evict oldest entries beyond this limit
 
 
+class BatchedEmbedder:
+    """Coalesce concurrent single-text embed() calls into batched requests.
+
+    Calls arriving within max_delay seconds of the first pending one (or until
+    max_batch texts are queued) share one embed_batch() round trip; each
+    caller gets its own vector back.
+    """
+
+    def __init__(self, embed_batch, max_batch: int = 32, max_delay: float = 0.008):
+        self._embed_batch = embed_batch
+        self._max_batch = max_batch
+        self._max_delay = max_delay
+        self._pending: list[tuple[str, asyncio.Future]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._flushes: set[asyncio.Task] = set()
+
+    async def embed(self, text: str) -> list[float]:
+        loop = asyncio.get_running_loop()
+        fut = loop.create_future()
+        self._pending.append((text, fut))
+        if len(self._pending) >= self._max_batch:
+            self._start_flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self._max_delay, self._start_flush)
+        return await fut
+
+    def _start_flush(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        if batch:
+            task = asyncio.get_running_loop().create_task(self._flush(batch))
+            self._flushes.add(task)
+            task.add_done_callback(self._flushes.discard)
+
+    async def _flush(self, batch: list[tuple[str, asyncio.Future]]):
+        try:
+            vectors = await self._embed_batch([text for text, _ in batch])
+            if len(vectors) != len(batch):
+                raise RuntimeError(f"Embedding API returned {len(vectors)} vectors for {len(batch)} inputs")
+        except Exception as e:
+            for _, fut in batch:
+                if not fut.done():
+                    fut.set_exception(e)
+            return
+        for (_, fut), vector in zip(batch, vectors):
+            if not fut.done():  # caller may have been cancelled
+                fut.set_result(vector)
+
+
 class VectorMemory:
     def __init__(self):
         self.entries: list[dict] = []  # {text, vector, tags, timestamp}
@@ -28,6 +79,7 @@ class VectorMemory:
         self._api_base: Optional[str] = None
         self._embed_model: Optional[str] = None
         self._lock = asyncio.Lock()
+        self._client: Optional[httpx.AsyncClient] = None
         self._load()
 
     def set_embedder(self, api_base: str, model_id: str):
@@ -35,18 +87,47 @@ class VectorMemory:
         self._api_base = api_base
         self._embed_model = model_id
 
+    def _get_client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            self._client = httpx.AsyncClient(timeout=30)
+        return self._client
+
+    async def close(self):
+        """Close the embedding HTTP client."""
+        if self._client:
+            await self._client.aclose()
+            self._client = None
+
     async def embed(self, text: str) -> list[float]:
         """Generate embedding vector for text via LM Studio HTTP API."""
         if not self._api_base or not self._embed_model:
             raise RuntimeError("Embedder not configured")
         try:
-            async with httpx.AsyncClient(timeout=30) as client:
-                resp = await client.post(
-                    f"{self._api_base}/v1/embeddings",
-                    json={"model": self._embed_model, "input": text},
-                )
-                resp.raise_for_status()
-                return resp.json()["data"][0]["embedding"]
+            resp = await self._get_client().post(
+                f"{self._api_base}/v1/embeddings",
+                json={"model": self._embed_model, "input": text},
+            )
+            resp.raise_for_status()
+            return resp.json()["data"][0]["embedding"]
+        except httpx.HTTPStatusError as e:
+            raise RuntimeError(f"Embedding API returned {e.response.status_code}: {e.response.text[:200]}")
+        except httpx.ConnectError as e:
+            raise RuntimeError(f"Cannot connect to embedding API at {self._api_base}: {e}")
+        except Exception as e:
+            raise RuntimeError(f"Embedding failed: {e}")
+
+    async def embed_batch(self, texts: list[str]) -> list[list[float]]:
+        """Embed several texts in one /v1/embeddings request (order preserved)."""
+        if not self._api_base or not self._embed_model:
+            raise RuntimeError("Embedder not configured")
+        try:
+            resp = await self._get_client().post(
+                f"{self._api_base}/v1/embeddings",
+                json={"model": self._embed_model, "input": texts},
+            )
+            resp.raise_for_status()
+            data = sorted(resp.json()["data"], key=lambda d: d.get("index", 0))
+            return [d["embedding"] for d in data]
         except httpx.HTTPStatusError as e:
             raise RuntimeError(f"Embedding API returned {e.response.status_code}: {e.response.text[:200]}")
         except httpx.ConnectError as e:
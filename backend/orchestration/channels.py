@@ -8,6 +8,7 @@ channels they have permission for. Backed by SQLite.
 import json
 import logging
 import sqlite3
+import time
 import uuid
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
@@ -19,14 +20,23 @@ from config import CHANNEL_DEFINITIONS
 logger = logging.getLogger(__name__)
 
 
+def _iso_to_epoch(timestamp: str) -> float:
+    """Parse a stored ISO-8601 timestamp to epoch seconds (0.0 if unparseable)."""
+    try:
+        return datetime.fromisoformat(timestamp).timestamp()
+    except (TypeError, ValueError):
+        return 0.0
+
+
 @dataclass
 class ChannelMessage:
     id: str
     channel: str
     sender: str
     content: str
-    timestamp: str
+    timestamp: str                  # ISO-8601, for display and persistence
     payload: dict = field(default_factory=dict)
+    ts: float = 0.0                 # epoch seconds, for comparisons
 
     def to_dict(self) -> dict:
         return {
@@ -35,6 +45,7 @@ class ChannelMessage:
             "sender": self.sender,
             "content": self.content,
             "timestamp": self.timestamp,
+            "ts": self.ts,
             "payload": self.payload,
         }
 
@@ -47,6 +58,7 @@ class ChannelMessage:
             content=d["content"],
             timestamp=d["timestamp"],
             payload=d.get("payload", {}),
+            ts=d.get("ts") or _iso_to_epoch(d["timestamp"]),
         )
 
 
@@ -147,13 +159,15 @@ class ChannelManager:
             logger.warning("BLOCKED: %s not allowed in %s", sender, channel_name)
             return None
 
+        now = time.time()
         msg = ChannelMessage(
             id=str(uuid.uuid4())[:12],
             channel=channel_name,
             sender=sender,
             content=content,
-            timestamp=datetime.now(timezone.utc).isoformat(),
+            timestamp=datetime.fromtimestamp(now, tz=timezone.utc).isoformat(),
             payload=payload or {},
+            ts=now,
         )
 
         channel.messages.append(msg)
@@ -199,6 +213,17 @@ class ChannelManager:
             })
         return result
 
+    def count_messages_since(self, since: float) -> int:
+        """Count messages across all channels posted after the epoch time `since`."""
+        count = 0
+        for ch in self._channels.values():
+            # Buffers are in posting order, so stop at the first older message
+            for msg in reversed(ch.messages):
+                if msg.ts <= since:
+                    break
+                count += 1
+        return count
+
     def get_channel_messages(self, channel_name: str,
                              limit: int = 50) -> list[dict]:
         """Get messages for a channel (for API — no permission check, owner's frontend)."""
@@ -59,6 +59,10 @@ class ModelManager:
         """Set the WebSocket broadcast function for model state events."""
         self._broadcast = broadcast_fn
 
+    def set_system_awareness(self, system_awareness):
+        """Attach live resource monitoring once Memory V2 is up."""
+        self._system = system_awareness
+
     # ── Startup ──
 
     async def start(self):
@@ -11,8 +11,11 @@ Usage:
     print(profile.system.name)
 """
 
+import hashlib
+import json
 import logging
 import os
+import tempfile
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional
@@ -26,6 +29,12 @@ _PROFILE_PATH_ENV = os.environ.get("PROFILE_PATH")
 _PROJECT_ROOT = Path(__file__).parent.parent
 _DEFAULT_PROFILE_PATH = _PROJECT_ROOT / "profile.yaml"
 
+# Parsed YAML is cached as JSON, keyed by the file's path, mtime and size
+_PROFILE_CACHE_DIR = Path(
+    os.environ.get("MOOSE_PROFILE_CACHE_DIR")
+    or Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "moose"
+)
+
 
 # ── Dataclasses ──
 
@@ -452,6 +461,47 @@ def _load_profile_from_dict(raw: dict) -> Profile:
     return profile
 
 
+def _profile_cache_path(profile_path: Path) -> Path:
+    digest = hashlib.blake2b(str(profile_path).encode(), digest_size=8).hexdigest()
+    return _PROFILE_CACHE_DIR / f"profile-{digest}.json"
+
+
+def _write_profile_cache(cache_path: Path, key: list, raw) -> None:
+    """Atomically write the parsed mapping, owner-only since profiles may hold secrets."""
+    try:
+        text = json.dumps({"key": key, "raw": raw})
+        if json.loads(text)["raw"] != raw:
+            return  # e.g. dates or non-string keys — not representable, skip caching
+        cache_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=cache_path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                f.write(text)
+            os.replace(tmp, cache_path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+    except (OSError, TypeError, ValueError) as e:
+        logger.debug("Profile cache not written: %s", e)
+
+
+def _read_raw_profile(profile_path: Path):
+    """Parse profile.yaml, reusing the cached parse while the file is unchanged."""
+    resolved = profile_path.resolve()
+    st = resolved.stat()
+    key = [str(resolved), st.st_mtime_ns, st.st_size]
+    cache_path = _profile_cache_path(resolved)
+    try:
+        cached = json.loads(cache_path.read_text())
+        if cached["key"] == key:
+            return cached["raw"]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    raw = yaml.safe_load(resolved.read_text())
+    _write_profile_cache(cache_path, key, raw)
+    return raw
+
+
 def _load_profile() -> Profile:
     """Load profile from YAML file. Falls back to defaults if missing."""
     profile_path = Path(_PROFILE_PATH_ENV) if _PROFILE_PATH_ENV else _DEFAULT_PROFILE_PATH
@@ -461,7 +511,7 @@ def _load_profile() -> Profile:
         return Profile()
 
     try:
-        raw = yaml.safe_load(profile_path.read_text()) or {}
+        raw = _read_raw_profile(profile_path) or {}
         if not isinstance(raw, dict):
             logger.warning("profile.yaml is not a valid YAML mapping — using defaults")
             return Profile()
@@ -492,4 +542,7 @@ def reload_profile() -> Profile:
     """Force reload of the profile from disk."""
     global _profile
     _profile = _load_profile()
+    # Prompts cache profile-derived text; imported here to avoid a cycle
+    from agents.prompts import invalidate_profile_snapshot
+    invalidate_profile_snapshot()
     return _profile
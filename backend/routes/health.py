@@ -50,7 +50,7 @@ async def rotate_api_key():
     key_path = Path(__file__).parent.parent / ".moose_api_key"
     key_path.write_text(new_key)
     key_path.chmod(0o600)
-    _auth.MOOSE_API_KEY = new_key
+    _auth.set_api_key(new_key)
 
     return {"new_key": new_key, "old_key_valid_until": now + grace_period}
 
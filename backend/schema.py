@@ -191,6 +191,8 @@ def init_db():
     c.execute('CREATE INDEX IF NOT EXISTS idx_prospects_campaign ON prospects(campaign_id)')
     c.execute('CREATE INDEX IF NOT EXISTS idx_outreach_status ON outreach_attempts(status)')
     c.execute('CREATE INDEX IF NOT EXISTS idx_outreach_followup ON outreach_attempts(follow_up_date)')
+    # Serves the cognitive loop's "status IN (...) AND updated_at > ?" counters
+    c.execute('CREATE INDEX IF NOT EXISTS idx_outreach_status_updated ON outreach_attempts(status, updated_at)')
     # Add sent_at and message_id columns to outreach_attempts (idempotent)
     try:
         c.execute("ALTER TABLE outreach_attempts ADD COLUMN sent_at REAL")
@@ -222,6 +224,10 @@ def init_db():
         c.execute("ALTER TABLE content_drafts ADD COLUMN platform_post_id TEXT")
     except sqlite3.OperationalError:
         pass  # column already exists
+    # Status + recency lookups, and the published-posts-per-platform engagement scan
+    c.execute('CREATE INDEX IF NOT EXISTS idx_content_drafts_status_updated ON content_drafts(status, updated_at DESC)')
+    c.execute('CREATE INDEX IF NOT EXISTS idx_drafts_platform_post ON content_drafts(platform, status, updated_at DESC) '
+              'WHERE platform_post_id IS NOT NULL')
     # Content accounts (future-ready for social API integrations)
     c.execute('''CREATE TABLE IF NOT EXISTS content_accounts (
         id TEXT PRIMARY KEY, platform TEXT NOT NULL, handle TEXT NOT NULL,
@@ -326,8 +332,12 @@ def init_db():
         metadata TEXT
     )''')
     c.execute('CREATE INDEX IF NOT EXISTS idx_audit_timestamp ON audit_log(timestamp)')
-    c.execute('CREATE INDEX IF NOT EXISTS idx_audit_event_type ON audit_log(event_type)')
-    c.execute('CREATE INDEX IF NOT EXISTS idx_audit_actor ON audit_log(actor)')
+    # Composite indexes serve AuditLogger.query's filter + ORDER BY timestamp DESC;
+    # they supersede the old single-column event_type/actor indexes.
+    c.execute('CREATE INDEX IF NOT EXISTS idx_audit_event_ts ON audit_log(event_type, timestamp DESC)')
+    c.execute('CREATE INDEX IF NOT EXISTS idx_audit_actor_ts ON audit_log(actor, timestamp DESC)')
+    c.execute('DROP INDEX IF EXISTS idx_audit_event_type')
+    c.execute('DROP INDEX IF EXISTS idx_audit_actor')
     conn.commit()
 
     # Initialize plugin tables
@@ -17,6 +17,7 @@ sys.path.insert(0, str(BACKEND_DIR))
 
 # Set up a minimal profile before importing anything that reads config
 os.environ["PROFILE_PATH"] = str(BACKEND_DIR.parent / "profile.yaml.example")
+os.environ.setdefault("MOOSE_PROFILE_CACHE_DIR", tempfile.mkdtemp(prefix="moose-profile-cache-"))
 
 
 @pytest.fixture
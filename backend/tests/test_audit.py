@@ -0,0 +1,95 @@
+"""
+Tests for the audit logger's batched background writer.
+"""
+
+import json
+import sqlite3
+
+import pytest
+
+
+@pytest.fixture
+def audit_db(tmp_path, monkeypatch):
+    """Point db_connection() at a temporary database with an audit_log table."""
+    import db
+
+    db_path = tmp_path / "audit.db"
+    conn = sqlite3.connect(db_path)
+    conn.execute("""CREATE TABLE audit_log (
+        id TEXT PRIMARY KEY,
+        timestamp REAL NOT NULL,
+        event_type TEXT NOT NULL,
+        actor TEXT,
+        ip_address TEXT,
+        endpoint TEXT,
+        method TEXT,
+        status_code INTEGER,
+        request_summary TEXT,
+        metadata TEXT
+    )""")
+    conn.commit()
+    conn.close()
+    monkeypatch.setattr(db, "DB_PATH", db_path)
+    return db_path
+
+
+class TestAuditLogger:
+    """Test audit event queueing, flushing, and querying."""
+
+    def test_logged_events_are_written_in_batch(self, audit_db):
+        """Events logged back-to-back should all be persisted after flush()."""
+        from audit import AuditLogger, audit
+
+        for i in range(25):
+            audit("api_request", ip_address="127.0.0.1", endpoint=f"/api/{i}")
+        assert AuditLogger.flush(timeout=5.0)
+
+        conn = sqlite3.connect(audit_db)
+        count = conn.execute("SELECT COUNT(*) FROM audit_log").fetchone()[0]
+        conn.close()
+        assert count == 25
+
+    def test_query_sees_recent_events(self, audit_db):
+        """query() should include events logged immediately before it."""
+        from audit import AuditLogger, audit_auth_failure
+
+        audit_auth_failure("10.0.0.1", "/api/query", reason="bad key")
+        rows = AuditLogger.query(event_type="auth_failure")
+
+        assert len(rows) == 1
+        assert rows[0]["ip_address"] == "10.0.0.1"
+        assert json.loads(rows[0]["metadata"]) == {"reason": "bad key"}
+
+    def test_unserializable_metadata_does_not_drop_batch(self, audit_db):
+        """A bad metadata payload should only drop its own row."""
+        from audit import AuditLogger, audit
+
+        audit("security_flag", metadata={"obj": object()})
+        audit("security_flag", metadata={"ok": True})
+        assert AuditLogger.flush(timeout=5.0)
+
+        rows = AuditLogger.query(event_type="security_flag")
+        assert [json.loads(r["metadata"]) for r in rows] == [{"ok": True}]
+
+    def test_metadata_stdlib_json_accepts_is_stored(self, audit_db):
+        """Metadata with int keys or big ints should be stored, as with stdlib json."""
+        from audit import AuditLogger, audit
+
+        audit("security_flag", metadata={1: "a", "big": 2 ** 70})
+        assert AuditLogger.flush(timeout=5.0)
+
+        rows = AuditLogger.query(event_type="security_flag")
+        assert [json.loads(r["metadata"]) for r in rows] == [{"1": "a", "big": 2 ** 70}]
+
+    def test_unknown_event_type_warns_once(self, audit_db, caplog):
+        """A repeated unknown event type should only be warned about once."""
+        from audit import AuditLogger, audit
+
+        with caplog.at_level("WARNING", logger="audit"):
+            for _ in range(3):
+                audit("not_a_real_event")
+        assert AuditLogger.flush(timeout=5.0)
+
+        warnings = [r for r in caplog.records if "Unknown audit event type" in r.getMessage()]
+        assert len(warnings) == 1
+        assert len(AuditLogger.query(event_type="not_a_real_event")) == 3
@@ -0,0 +1,91 @@
+"""
+Tests for API key verification and input sanitization.
+"""
+
+import pytest
+from unittest.mock import MagicMock
+
+from fastapi import HTTPException
+
+
+@pytest.fixture
+def auth_module(monkeypatch):
+    """Import auth with a known key (env var set so no key file is written)."""
+    monkeypatch.setenv("MOOSE_API_KEY", "test-key-123")
+    import auth
+
+    original = auth.MOOSE_API_KEY
+    auth.set_api_key("test-key-123")
+    yield auth
+    auth.set_api_key(original)
+
+
+def _request(key=None):
+    request = MagicMock()
+    request.headers = {"x-api-key": key} if key is not None else {}
+    return request
+
+
+class TestVerifyApiKey:
+    """Test the X-API-Key dependency."""
+
+    def test_valid_key_accepted(self, auth_module):
+        assert auth_module.verify_api_key(_request("test-key-123")) is None
+
+    @pytest.mark.parametrize("key", [None, "", "wrong", "test-key-123é", "test-key-12"])
+    def test_invalid_key_rejected(self, auth_module, key):
+        with pytest.raises(HTTPException) as exc:
+            auth_module.verify_api_key(_request(key))
+        assert exc.value.status_code == 401
+
+    def test_rotated_key_takes_effect(self, auth_module):
+        auth_module.set_api_key("rotated-key")
+        with pytest.raises(HTTPException):
+            auth_module.verify_api_key(_request("test-key-123"))
+        assert auth_module.verify_api_key(_request("rotated-key")) is None
+
+    def test_only_accepted_keys_are_cached(self, auth_module):
+        with pytest.raises(HTTPException):
+            auth_module.verify_api_key(_request("wrong"))
+        auth_module.verify_api_key(_request("test-key-123"))
+        assert auth_module._accepted_keys == {"test-key-123"}
+
+        auth_module.set_api_key("rotated-key")
+        assert auth_module._accepted_keys == set()
+        with pytest.raises(HTTPException):
+            auth_module.verify_api_key(_request("test-key-123"))
+
+
+class TestApiKeyFile:
+    """Test create-or-load of the persisted API key."""
+
+    def test_creates_key_once_with_private_mode(self, auth_module, tmp_path, monkeypatch):
+        import os
+
+        key_path = tmp_path / ".moose_api_key"
+        monkeypatch.setattr(auth_module, "_API_KEY_PATH", key_path)
+
+        first = auth_module._load_or_create_api_key()
+        assert len(first) >= 32
+        assert auth_module._load_or_create_api_key() == first
+        assert os.stat(key_path).st_mode & 0o777 == 0o600
+
+    def test_reads_existing_key(self, auth_module, tmp_path, monkeypatch):
+        key_path = tmp_path / ".moose_api_key"
+        key_path.write_text("existing-key\n")
+        monkeypatch.setattr(auth_module, "_API_KEY_PATH", key_path)
+
+        assert auth_module._load_or_create_api_key() == "existing-key"
+
+
+class TestSanitizeInput:
+    """Test HTML stripping, escaping, and truncation."""
+
+    def test_strips_tags_and_escapes(self, auth_module):
+        assert auth_module.sanitize_input('<b>hi</b> & "x"') == "hi &amp; &quot;x&quot;"
+
+    def test_truncates_long_input(self, auth_module):
+        assert auth_module.sanitize_input("a" * 600 + "<i>", 10) == "a" * 10
+
+    def test_empty_input(self, auth_module):
+        assert auth_module.sanitize_input("") == ""
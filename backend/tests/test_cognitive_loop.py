@@ -0,0 +1,464 @@
+"""
+Tests for the CognitiveLoop OODA cycle.
+Tests observation gathering, decisions, and briefings against a temporary database.
+"""
+
+import json
+import sqlite3
+import time
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+
+@pytest.fixture
+def loop_db(tmp_path, monkeypatch):
+    """Point the schema and db_connection_row() at a fresh temporary database."""
+    import db
+    import schema
+
+    db_path = tmp_path / "loop.db"
+    monkeypatch.setattr(schema, "DB_PATH", db_path)
+    monkeypatch.setattr(db, "DB_PATH", db_path)
+    schema.init_db()
+    return db_path
+
+
+@pytest.fixture
+def loop(loop_db):
+    """A CognitiveLoop wired to a mocked AgentCore."""
+    from cognitive_loop import CognitiveLoop
+
+    core = MagicMock()
+    core.registry = None
+    core.channel_manager = None
+    core.model_manager = None
+    core._tasks = {}
+    core.ws_clients = []
+    core._briefings = []
+    core.memory._api_base = None
+    core.memory.count.return_value = 0
+    core.broadcast = AsyncMock()
+    core.broadcast_text = AsyncMock()
+    return CognitiveLoop(core)
+
+
+def _seed(db_path, drafts=(), emails=()):
+    now = time.time()
+    conn = sqlite3.connect(db_path)
+    for i, (status, title) in enumerate(drafts):
+        conn.execute(
+            "INSERT INTO content_drafts (id, content_type, title, status, created_at, updated_at) VALUES (?, 'post', ?, ?, ?, ?)",
+            (f"d{i}", title, status, now, now),
+        )
+    for i, status in enumerate(emails):
+        conn.execute(
+            "INSERT INTO marketing_emails (id, status, created_at, updated_at) VALUES (?, ?, ?, ?)",
+            (f"e{i}", status, now, now),
+        )
+    conn.commit()
+    conn.close()
+
+
+class TestCognitiveLoopCycle:
+    """Test the per-cycle database reads share one connection."""
+
+    async def test_observe_reports_marketing_stats(self, loop, loop_db):
+        """_observe should summarize draft and email counts from the cycle connection."""
+        _seed(loop_db, drafts=[("drafted", "a"), ("drafted", "b"), ("published", "c")],
+              emails=["pending", "sent"])
+        async with loop._cycle_conn() as conn:
+            observations = await loop._observe(conn)
+
+        stats = next(o for o in observations if o["source"] == "marketing")
+        assert stats["content_stats"] == {"drafted": 2, "published": 1}
+        assert stats["email_stats"] == {"pending": 1, "sent": 1}
+        assert stats["pending_content"] == 2
+        assert stats["recent_responses"] == 0
+
+    async def test_decide_skips_recently_drafted_titles(self, loop, loop_db):
+        """Content angles matching a recent draft title should not be re-drafted."""
+        insight = {"type": "content_angle", "source": "security", "urgency": 0.5,
+                   "content_suggestion": "Post about X"}
+        async with loop._cycle_conn() as conn:
+            assert [a["action"] for a in await loop._decide([dict(insight)], conn)] == ["draft_content"]
+            _seed(loop_db, drafts=[("drafted", "post about x")])
+            assert len(await loop._decide([dict(insight)], conn)) == 1  # title cache still fresh
+            loop._recent_titles_cache = (float("-inf"), set())
+            assert await loop._decide([dict(insight)], conn) == []
+
+    async def test_drafted_content_updates_title_cache(self, loop, monkeypatch):
+        """A draft made this cycle should be deduplicated before the cache expires."""
+        import tools_content
+
+        monkeypatch.setattr(tools_content, "draft_content", lambda **kw: '{"draft_id": "d1"}')
+        insight = {"type": "content_angle", "source": "security", "urgency": 0.5,
+                   "content_suggestion": "Post about Y"}
+        async with loop._cycle_conn() as conn:
+            assert len(await loop._decide([dict(insight)], conn)) == 1
+            await loop._act_draft_content(insight)
+            assert await loop._decide([dict(insight)], conn) == []
+
+    async def test_persona_tokens_cached_until_persona_write(self, loop, loop_db):
+        """_get_persona_tokens should serve the cache until a persona is created."""
+        import tools_icp
+
+        assert await loop._get_persona_tokens() == []
+        tools_icp.create_persona("Sam", "solo_attorney", pain_points="Breach, audit,,fines,extra")
+        tokens = await loop._get_persona_tokens()
+        assert [(name, terms) for _, name, terms in tokens] == [("Sam", ("breach", "audit"))]
+        assert await loop._get_persona_tokens() is tokens
+
+    async def test_orient_matches_content_angles_to_personas(self, loop, loop_db):
+        """Security content angles should be tagged with the first matching persona."""
+        import tools_icp
+
+        tools_icp.create_persona("Sam", "solo_attorney", pain_points="ransomware, audit")
+        observations = [{"source": "security", "type": "security_flag", "category": "malware",
+                         "confidence": 0.5, "summary": "Ransomware payload in attachment"}]
+        insights = await loop._orient(observations)
+        assert insights[0]["matched_persona_name"] == "Sam"
+
+    async def test_orient_reads_personas_on_cycle_connection(self, loop, loop_db, monkeypatch):
+        """A cache miss in _orient should query personas on the passed connection."""
+        import cognitive_loop
+        import tools_icp
+
+        tools_icp.create_persona("Sam", "solo_attorney", pain_points="ransomware")
+        observations = [{"source": "security", "type": "security_flag", "category": "malware",
+                         "confidence": 0.5, "summary": "Ransomware payload"}]
+        async with loop._cycle_conn() as conn:
+            monkeypatch.setattr(cognitive_loop, "db_connection_row", MagicMock(side_effect=AssertionError))
+            insights = await loop._orient(observations, conn)
+        assert insights[0]["matched_persona_name"] == "Sam"
+
+    async def test_generate_briefing_uses_cycle_connection(self, loop, loop_db):
+        """Briefings should read their counts from the passed connection."""
+        _seed(loop_db, drafts=[("drafted", "a")], emails=["pending"])
+        async with loop._cycle_conn() as conn:
+            await loop._generate_briefing("morning", conn)
+
+        briefing = loop._core._briefings[-1]
+        assert briefing["briefing_type"] == "morning"
+        assert "1 drafts pending approval" in briefing["content"]
+        assert "1 emails pending" in briefing["content"]
+        loop._core.broadcast.assert_awaited_once()
+
+    async def test_evening_briefing_template(self, loop, loop_db):
+        """The evening summary should fill every placeholder of its template."""
+        _seed(loop_db, drafts=[("published", "a"), ("drafted", "b")], emails=["pending", "pending"])
+        loop.cycle_count = 42
+        async with loop._cycle_conn() as conn:
+            await loop._generate_briefing("evening", conn)
+
+        content = loop._core._briefings[-1]["content"]
+        assert content.startswith("**Evening Summary**")
+        assert "1 pieces published, 0 emails sent" in content
+        assert "Pending: 1 content drafts, 2 emails awaiting approval" in content
+        assert content.endswith("42 total cycles")
+
+    async def test_cycle_connection_is_read_only(self, loop):
+        """The shared cycle connection should reject writes."""
+        async with loop._cycle_conn() as conn:
+            assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+            with pytest.raises(sqlite3.OperationalError):
+                conn.execute("DELETE FROM content_drafts")
+
+    async def test_persona_matching_backends_agree(self, loop, loop_db, monkeypatch):
+        """The Aho-Corasick path (when installed) and the substring fallback should agree."""
+        import cognitive_loop
+        import tools_icp
+
+        tools_icp.create_persona("Ann", "solo_attorney", pain_points="client data, billing")
+        tools_icp.create_persona("Bo", "privacy_founder", pain_points="breach, client data")
+        samples = ["a breach of client data", "breach only", "nothing relevant", "billing"]
+
+        await loop._get_persona_tokens()
+        native = [(p or ("", ""))[1] for p in map(loop._first_matching_persona, samples)]
+        monkeypatch.setattr(cognitive_loop, "HAS_AHOCORASICK", False)
+        tools_icp._bump_persona_version()
+        await loop._get_persona_tokens()
+        fallback = [(p or ("", ""))[1] for p in map(loop._first_matching_persona, samples)]
+
+        assert native == fallback == ["Ann", "Bo", "", "Ann"]
+
+    async def test_observe_counts_new_channel_messages(self, loop, loop_db, monkeypatch):
+        """Only channel messages posted since the last observation should be counted."""
+        from orchestration import channels
+
+        monkeypatch.setattr(channels, "DB_PATH", loop_db)
+        monkeypatch.setattr(channels, "CHANNEL_DEFINITIONS", {"general": {"coder"}, "ops": {"coder"}})
+        manager = channels.ChannelManager()
+        loop._core.channel_manager = manager
+        manager.post("general", "coder", "before")
+
+        async with loop._cycle_conn() as conn:
+            await loop._observe(conn)
+            manager.post("general", "coder", "one")
+            manager.post("ops", "coder", "two")
+            observations = await loop._observe(conn)
+
+        counts = [o["count"] for o in observations if o["source"] == "channels"]
+        assert counts == [2]
+        assert manager.count_messages_since(0.0) == 3
+
+    def test_reloaded_channel_messages_keep_epoch_ts(self, loop_db, monkeypatch):
+        """Messages loaded from SQLite should get ts parsed from their ISO timestamp."""
+        from orchestration import channels
+
+        monkeypatch.setattr(channels, "DB_PATH", loop_db)
+        monkeypatch.setattr(channels, "CHANNEL_DEFINITIONS", {"general": {"coder"}})
+        posted = channels.ChannelManager().post("general", "coder", "hello")
+
+        reloaded = channels.ChannelManager().get_channel_messages("general")
+        assert reloaded[0]["ts"] == pytest.approx(posted.ts, abs=1e-3)
+        assert reloaded[0]["timestamp"] == posted.timestamp
+
+    async def test_observe_fetches_moltbook_stats_concurrently(self, loop, loop_db, monkeypatch):
+        """Per-post stats are fetched together; one failing post doesn't drop the rest."""
+        import asyncio
+        from integrations import moltbook
+
+        conn = sqlite3.connect(loop_db)
+        for i in range(3):
+            conn.execute(
+                "INSERT INTO content_drafts (id, content_type, title, status, platform, platform_post_id, created_at, updated_at) "
+                "VALUES (?, 'moltbook_post', 't', 'published', 'moltbook', ?, ?, ?)",
+                (f"d{i}", f"p{i}", i, i),
+            )
+        conn.commit()
+        conn.close()
+
+        in_flight = []
+
+        async def get_post_stats(post_id):
+            in_flight.append(post_id)
+            await asyncio.sleep(0.01)
+            assert len(in_flight) == 3  # all requests started before any finished
+            if post_id == "p1":
+                raise RuntimeError("rate limited")
+            return {"views": 5}
+
+        client = MagicMock(is_configured=lambda: True, get_post_stats=get_post_stats)
+        monkeypatch.setattr(moltbook, "get_moltbook_client", lambda: client)
+
+        async with loop._cycle_conn() as conn:
+            observations = await loop._observe(conn)
+
+        engagement = [o["platform_post_id"] for o in observations if o["source"] == "moltbook"]
+        assert engagement == ["p2", "p0"]
+
+    async def test_notify_urgent_cuts_sleep_short(self, loop):
+        """notify_urgent() should end the inter-cycle sleep immediately."""
+        import asyncio
+
+        asyncio.get_running_loop().call_later(0.01, loop.notify_urgent)
+        await asyncio.wait_for(loop._sleep_until_woken(60), timeout=1)
+        assert not loop._wakeup.is_set()
+
+        await loop._sleep_until_woken(0.01)  # times out normally when not notified
+
+    async def test_orient_derives_insights_per_observation_kind(self, loop):
+        """Each observation kind should produce its corresponding insight type."""
+        observations = [
+            {"source": "marketing", "type": "stats", "recent_responses": 2, "pending_content": 5},
+            {"source": "moltbook", "type": "engagement", "draft_id": "d1", "stats": {"views": 150}},
+            {"source": "system", "type": "model_health", "failed_loads": ["coder"], "task_failures": 3},
+            {"source": "system", "type": "health", "active_tasks": 0},
+        ]
+        insights = await loop._orient(observations)
+        assert [i["type"] for i in insights] == [
+            "engagement_signal", "queue_alert", "content_performance", "capability_gap", "capability_gap",
+        ]
+
+    async def test_decide_keeps_most_urgent_insights(self, loop):
+        """_decide should act on at most _MAX_DECIDE_INSIGHTS insights, most urgent first."""
+        loop._MAX_DECIDE_INSIGHTS = 3
+        insights = [{"type": "capability_gap", "urgency": u, "description": str(u)}
+                    for u in (0.1, 0.9, 0.5, 0.7, 0.3)]
+        async with loop._cycle_conn() as conn:
+            actions = await loop._decide(insights, conn)
+        assert [a["urgency"] for a in actions] == [0.9, 0.7, 0.5]
+
+    async def test_decide_and_act_route_each_insight_type(self, loop, monkeypatch):
+        """Insight types should map to their actions, and _act should dispatch them."""
+        from cognitive_loop import CognitiveLoop
+
+        loop._core.ws_clients = [object()]
+        insights = [
+            {"type": "content_angle", "source": "security", "urgency": 0.9,
+             "content_suggestion": "Write about Z", "matched_persona_id": "p1"},
+            {"type": "queue_alert", "urgency": 0.4, "summary": "5 pending"},
+            {"type": "pattern", "urgency": 0.3, "summary": "breach"},
+            {"type": "unknown", "urgency": 0.2},
+        ]
+        async with loop._cycle_conn() as conn:
+            actions = await loop._decide(insights, conn)
+        assert [a["action"] for a in actions] == [
+            "draft_content", "draft_outreach", "urgent_notify", "notify_user", "store_pattern",
+        ]
+
+        called = []
+        for name in CognitiveLoop._ACTION_DISPATCH:
+            async def _record(self, insight, name=name):
+                called.append(name)
+            monkeypatch.setitem(CognitiveLoop._ACTION_DISPATCH, name, _record)
+        await loop._act(actions + [{"action": "bogus"}])
+        assert called == [a["action"] for a in actions]
+
+    def test_thought_journal_is_bounded(self, loop):
+        """thought_journal should keep only the newest _MAX_THOUGHT_JOURNAL entries."""
+        for i in range(loop._MAX_THOUGHT_JOURNAL + 5):
+            loop.thought_journal.append({"type": "content_drafted", "n": i})
+        assert len(loop.thought_journal) == loop._MAX_THOUGHT_JOURNAL
+        assert loop.thought_journal[0]["n"] == 5
+
+    async def test_orient_reuses_memory_search_when_only_health_changes(self, loop):
+        """Memory search should be skipped unless non-health observations change."""
+        loop._core.memory._api_base = "http://localhost"
+        loop._core.memory.search = AsyncMock(return_value=[])
+
+        def _obs(active_tasks, summary="Prompt injection attempt"):
+            return [
+                {"source": "security", "type": "security_flag", "category": "x",
+                 "confidence": 0.5, "summary": summary},
+                {"source": "system", "type": "health", "active_tasks": active_tasks, "memory_entries": 0},
+            ]
+
+        await loop._orient(_obs(1))
+        await loop._orient(_obs(2))
+        assert loop._core.memory.search.await_count == 1
+
+        await loop._orient(_obs(2, summary="New exfiltration attempt"))
+        assert loop._core.memory.search.await_count == 2
+
+    async def test_phase_changes_coalesce_into_one_broadcast(self, loop):
+        """Rapid phase changes should produce a single status broadcast of the last phase."""
+        for phase in ("observe", "orient", "decide", "act", "idle"):
+            loop._set_phase(phase)
+        await loop._status_task
+
+        loop._core.broadcast_text.assert_awaited_once()
+        assert json.loads(loop._core.broadcast_text.await_args.args[0])["phase"] == "idle"
+
+    async def test_phase_change_during_inflight_send_is_broadcast(self, loop):
+        """A phase set while a status send is in flight should still go out."""
+        import asyncio
+        sent = []
+
+        async def slow_send(text):
+            sent.append(json.loads(text)["phase"])
+            await asyncio.sleep(0.05)
+
+        loop._core.broadcast_text = slow_send
+        loop._set_phase("act")
+        await asyncio.sleep(loop._STATUS_COALESCE_SECONDS + 0.01)
+        assert sent == ["act"]  # first send now in flight
+
+        loop._set_phase("idle")
+        await loop._status_task
+
+        assert sent == ["act", "idle"]
+
+    def test_adaptive_interval_backs_off_while_idle(self, loop):
+        """Idle cycles should stretch the interval geometrically up to the cap."""
+        assert loop._adaptive_interval(1, 0) == loop.cycle_interval
+
+        # A few quiet cycles don't stretch the interval yet
+        loop._idle_streak = loop._IDLE_BACKOFF_AFTER - 1
+        assert loop._adaptive_interval(1, 0) == loop.cycle_interval
+        assert loop._adaptive_interval(6, 0) == max(loop.min_interval, loop.cycle_interval // 2)
+
+        loop._idle_streak = loop._IDLE_BACKOFF_AFTER
+        assert loop._adaptive_interval(1, 0) == loop.cycle_interval * 1.5
+
+        loop._idle_streak = 50
+        assert loop._adaptive_interval(1, 0) == min(
+            loop.cycle_interval * 1.5 ** loop._IDLE_BACKOFF_STEPS, loop._MAX_IDLE_INTERVAL)
+
+        # Security flags still pull the loop back to the fast interval
+        assert loop._adaptive_interval(1, 1) == loop.min_interval
+
+    async def test_obs_security_records_urgent_count(self, loop):
+        """_obs_security should tally flags so _adaptive_interval needn't rescan."""
+        flag = MagicMock(category="x", confidence=0.9, summary="s")
+        security = MagicMock()
+        security.get_and_clear_audit_data.return_value = ([], [flag, flag])
+        loop._core.registry = MagicMock()
+        loop._core.registry.get.return_value = security
+
+        await loop._obs_security(time.time())
+        assert loop._urgent_count == 2
+
+        security.get_and_clear_audit_data.return_value = ([], [])
+        await loop._obs_security(time.time())
+        assert loop._urgent_count == 0
+
+    def test_detect_patterns_counts_keywords_in_one_pass(self, loop):
+        """Keywords seen at least twice (case-insensitive, as substrings) are reported in order."""
+        memory_texts = ["Data BREACH reported", "Cybersecurity audit"]
+        summaries = ["Second breach this week", "privacy policy", "security review"]
+        assert loop._detect_patterns(memory_texts, summaries) == (
+            "Recurring themes detected: breach, security")
+        assert loop._detect_patterns([], ["outreach"]) is None
+
+    def test_summarize_observations_caps_at_ten(self, loop):
+        """Only the first ten observations should be summarized."""
+        observations = [{"source": "security", "type": "security_flag", "summary": f"flag {i}"}
+                        for i in range(25)]
+        observations.insert(0, {"source": "system", "type": "health", "active_tasks": 2, "memory_entries": 7})
+        parts = loop._summarize_observations(observations).split("; ")
+        assert len(parts) == 10
+        assert parts[0] == "[system] 2 active tasks, 7 memories"
+        assert parts[-1] == "[security/security_flag] flag 8"
+
+    async def test_orient_detects_patterns_from_summaries(self, loop):
+        """Memory hits plus observation summaries should yield a pattern insight."""
+        loop._core.memory._api_base = "http://localhost"
+        loop._core.memory.search = AsyncMock(return_value=[{"text": "old breach report"}])
+        observations = [{"source": "security", "type": "security_flag", "category": "x",
+                         "confidence": 0.5, "summary": "New breach attempt"},
+                        {"source": "system", "type": "health", "active_tasks": 0, "memory_entries": 1}]
+
+        insights = await loop._orient(observations)
+        patterns = [i for i in insights if i["type"] == "pattern"]
+        assert patterns[0]["summary"] == "Recurring themes detected: breach"
+
+    async def test_unchanged_status_is_not_rebroadcast(self, loop):
+        """A status identical to the last one sent should not hit the WebSocket."""
+        await loop._broadcast_status()
+        await loop._broadcast_status()
+        assert loop._core.broadcast_text.await_count == 1
+
+        loop.cycle_count += 1
+        await loop._broadcast_status()
+        assert loop._core.broadcast_text.await_count == 2
+
+    async def test_status_frame_matches_dict_payload(self, loop):
+        """The pre-encoded status frame should decode to the documented payload."""
+        loop._phase = "orient"
+        loop.cycle_count = 3
+        loop.thought_journal.append({"n": 1})
+        await loop._broadcast_status()
+
+        assert json.loads(loop._core.broadcast_text.await_args.args[0]) == {
+            "type": "cognitive_status", "phase": "orient", "cycle": 3,
+            "observations": 0, "thoughts": 1,
+        }
+
+    def test_new_id_draws_from_pooled_randomness(self, loop, monkeypatch):
+        """IDs should be 12 hex chars, unique, with one urandom read per pool."""
+        import cognitive_loop
+
+        calls = []
+        real_urandom = cognitive_loop.os.urandom
+        monkeypatch.setattr(cognitive_loop.os, "urandom", lambda n: calls.append(n) or real_urandom(n))
+
+        per_pool = loop._ID_POOL_BYTES // loop._ID_BYTES
+        ids = [loop._new_id() for _ in range(per_pool)]
+        assert len(calls) == 1
+        assert len(set(ids)) == per_pool
+        assert all(len(i) == 12 and int(i, 16) >= 0 for i in ids)
+
+        loop._new_id()
+        assert len(calls) == 2
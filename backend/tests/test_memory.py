@@ -172,3 +172,60 @@ class TestEmbedderConfig:
         with pytest.raises(RuntimeError, match="Embedder not configured"):
             import asyncio
             asyncio.get_event_loop().run_until_complete(mem.embed("test"))
+
+    @pytest.mark.asyncio
+    async def test_embed_calls_share_one_http_client(self):
+        """Embedding requests should reuse a pooled client until close()."""
+        import httpx
+        from memory import VectorMemory
+
+        with patch.object(VectorMemory, "_load"):
+            mem = VectorMemory()
+        mem.set_embedder("http://embed.test", "nomic-embed")
+
+        def handler(request):
+            return httpx.Response(200, json={"data": [{"index": 0, "embedding": [0.5]}]})
+
+        client = mem._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        assert await mem.embed("a") == [0.5]
+        assert await mem.embed_batch(["b"]) == [[0.5]]
+        assert mem._get_client() is client
+
+        await mem.close()
+        assert client.is_closed
+        assert mem._client is None
+
+
+class TestBatchedEmbedder:
+    """Test coalescing of concurrent embed calls."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_batch(self):
+        """Concurrent embeds should go out as one ordered batch request."""
+        import asyncio
+        from memory import BatchedEmbedder
+
+        embed_batch = AsyncMock(side_effect=lambda texts: [[float(len(t))] for t in texts])
+        batcher = BatchedEmbedder(embed_batch, max_delay=0.01)
+
+        vectors = await asyncio.gather(*(batcher.embed(t) for t in ("a", "bb", "ccc")))
+
+        assert vectors == [[1.0], [2.0], [3.0]]
+        embed_batch.assert_awaited_once_with(["a", "bb", "ccc"])
+
+    @pytest.mark.asyncio
+    async def test_full_batch_flushes_immediately_and_errors_propagate(self):
+        """Reaching max_batch should flush at once; a failed batch fails every caller."""
+        import asyncio
+        from memory import BatchedEmbedder
+
+        embed_batch = AsyncMock(side_effect=RuntimeError("Embedding failed: down"))
+        batcher = BatchedEmbedder(embed_batch, max_batch=2, max_delay=60)
+
+        results = await asyncio.wait_for(
+            asyncio.gather(batcher.embed("x"), batcher.embed("y"), return_exceptions=True),
+            timeout=1,
+        )
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+        embed_batch.assert_awaited_once_with(["x", "y"])
@@ -0,0 +1,77 @@
+"""
+Tests for profile loading.
+Tests the on-disk cache of the parsed profile.yaml.
+"""
+
+import os
+import stat
+
+import pytest
+
+
+@pytest.fixture
+def profile_yaml(tmp_path, monkeypatch):
+    """A profile.yaml in a temp dir, with the parse cache in another."""
+    import profile
+
+    monkeypatch.setattr(profile, "_PROFILE_CACHE_DIR", tmp_path / "cache")
+    path = tmp_path / "profile.yaml"
+    path.write_text("system:\n  name: Cached\n")
+    return path
+
+
+class TestProfileCache:
+    """Test the mtime-keyed parse cache."""
+
+    def test_unchanged_yaml_served_from_cache(self, profile_yaml, monkeypatch):
+        """A second read of an unchanged file should not parse YAML."""
+        import profile
+
+        assert profile._read_raw_profile(profile_yaml) == {"system": {"name": "Cached"}}
+        cache_file = profile._profile_cache_path(profile_yaml.resolve())
+        assert stat.S_IMODE(cache_file.stat().st_mode) == 0o600
+
+        def _no_parse(_text):
+            raise AssertionError("YAML parsed despite a fresh cache")
+
+        monkeypatch.setattr(profile.yaml, "safe_load", _no_parse)
+        assert profile._read_raw_profile(profile_yaml) == {"system": {"name": "Cached"}}
+
+    def test_modified_yaml_is_reparsed(self, profile_yaml):
+        """Changing the file should invalidate the cached parse."""
+        import profile
+
+        profile._read_raw_profile(profile_yaml)
+        profile_yaml.write_text("system:\n  name: Edited version\n")
+        st = profile_yaml.stat()
+        os.utime(profile_yaml, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+        assert profile._read_raw_profile(profile_yaml) == {"system": {"name": "Edited version"}}
+
+    def test_non_json_values_are_not_cached(self, profile_yaml):
+        """YAML that doesn't survive a JSON round trip should skip the cache."""
+        import profile
+
+        profile_yaml.write_text("1: one\nwhen: 2024-01-01\n")
+        raw = profile._read_raw_profile(profile_yaml)
+        assert 1 in raw
+        assert not profile._profile_cache_path(profile_yaml.resolve()).exists()
+
+
+class TestReloadProfile:
+    """Test that reloading the profile refreshes dependent caches."""
+
+    def test_reload_invalidates_prompt_snapshot(self, monkeypatch):
+        """reload_profile() should drop the prompt module's profile snapshot."""
+        import profile
+        from agents import prompts
+
+        prompts.get_presentation_prompt()
+        prompts._profile_snapshot()
+        assert prompts._PROFILE_SNAPSHOT is not None
+
+        monkeypatch.setattr(profile, "_load_profile", lambda: profile.get_profile())
+        profile.reload_profile()
+
+        assert prompts._PROFILE_SNAPSHOT is None
+        assert prompts._presentation_prompt_cache is None
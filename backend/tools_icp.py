@@ -27,6 +27,20 @@ def _sanitize_text(text: str, max_length: int = 5000) -> str:
     return cleaned[:max_length]
 
 
+# Bumped on every persona write so in-process caches (e.g. the cognitive loop's) can invalidate.
+_persona_version = 0
+
+
+def persona_version() -> int:
+    """Return a counter that changes whenever a persona is created or updated."""
+    return _persona_version
+
+
+def _bump_persona_version():
+    global _persona_version
+    _persona_version += 1
+
+
 _VALID_ARCHETYPES = {
     "solo_attorney", "privacy_founder", "small_practice_doctor",
     "freelance_consultant", "small_tax_cpa_firm",
@@ -55,6 +69,7 @@ def create_persona(name: str, archetype: str, description: str = "",
                    _sanitize_text(email_tone, 500), _sanitize_text(preferred_platforms, 200),
                    now, now))
         c.commit()
+    _bump_persona_version()
     return json.dumps({"persona_id": pid, "name": name, "archetype": archetype})
 
 
@@ -98,6 +113,7 @@ def update_persona(persona_id: str, name: str = "", description: str = "",
     with db_connection_row() as c:
         c.execute(f"UPDATE icp_personas SET {sc} WHERE id = ?", vals)
         c.commit()
+    _bump_persona_version()
     return json.dumps({"persona_id": persona_id, "updated": list(updates.keys())})
 
 
@@ -9,10 +9,10 @@ WhiteRabbitNeo to analyze on a recurring schedule.
 import hashlib
 import json
 import logging
-import os
 import subprocess
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import Iterable
 
 logger = logging.getLogger(__name__)
 
@@ -93,11 +93,12 @@ def scan_network() -> dict:
     }
 
 
-def scan_file_integrity(watched_paths: list[str], baseline_path: str) -> dict:
+def scan_file_integrity(watched_paths: Iterable[str | Path], baseline_path: str) -> dict:
     """Checksum key directories and compare against baseline.
 
     Args:
-        watched_paths: List of directory paths to scan.
+        watched_paths: Directory paths to scan; "~" is expanded, so pre-expanded
+            Path objects (as in SECURITY_HEARTBEAT_CONFIG) pass straight through.
         baseline_path: Path to the baseline JSON file.
 
     Returns:
@@ -106,8 +107,7 @@ def scan_file_integrity(watched_paths: list[str], baseline_path: str) -> dict:
     current_checksums = {}
 
     for dir_path in watched_paths:
-        expanded = os.path.expanduser(dir_path)
-        p = Path(expanded)
+        p = dir_path if isinstance(dir_path, Path) else Path(dir_path).expanduser()
         if not p.exists():
             continue
         try: